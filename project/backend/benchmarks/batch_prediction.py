@@ -0,0 +1,61 @@
+import os
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(os.path.dirname(BACKEND_DIR), "data")
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, DATA_DIR)
+
+
+def load_rows(num_rows: int) -> list:
+    from generate_dataset import generate_patient_data
+
+    return generate_patient_data(num_patients=num_rows)
+
+
+def score_rows(rows: list) -> None:
+    from services.ml_service import ml_service
+
+    for row in rows:
+        predictions, features = ml_service.predict_condition(row)
+        severity_level, severity_score = ml_service.predict_severity(row)
+        ml_service.calculate_priority_score(
+            severity_score,
+            row.get("pain_level", 5),
+            features["duration_days"],
+            row["age"]
+        )
+
+
+def benchmark_batch_prediction(num_rows: int = 100000) -> dict:
+    import pandas as pd
+    from services.ml_service import ml_service
+
+    rows = load_rows(num_rows)
+    df = pd.DataFrame(rows)
+
+    start = time.perf_counter()
+    score_rows(rows)
+    per_row_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ml_service.predict_batch(df)
+    batch_seconds = time.perf_counter() - start
+
+    return {
+        "rows": num_rows,
+        "per_row_seconds": round(per_row_seconds, 3),
+        "batch_seconds": round(batch_seconds, 3),
+        "speedup": round(per_row_seconds / batch_seconds, 1)
+    }
+
+
+if __name__ == "__main__":
+    num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print(f"Scoring {num_rows} synthetic symptom records...")
+
+    result = benchmark_batch_prediction(num_rows)
+    print(f"  Per-row loop: {result['per_row_seconds']} s")
+    print(f"  predict_batch: {result['batch_seconds']} s")
+    print(f"  Speedup: {result['speedup']}x")
@@ -0,0 +1,81 @@
+import os
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(os.path.dirname(BACKEND_DIR), "data")
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, DATA_DIR)
+
+
+def time_single_rows(service, rows: list) -> dict:
+    latencies = []
+    for row in rows:
+        start = time.perf_counter()
+        service.predict_condition(row, age=row["age"])
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    return {
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 3),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95)] * 1000, 3)
+    }
+
+
+def accuracy(service, df) -> float:
+    predictions = service.predict_batch(df)["top_condition"].to_numpy()
+    return round(float((predictions == df["predicted_condition"].to_numpy()).mean()), 4)
+
+
+def time_batch(service, df) -> float:
+    start = time.perf_counter()
+    service.predict_batch(df)
+    return round(time.perf_counter() - start, 3)
+
+
+def benchmark_model_inference(model_path: str, num_rows: int = 1000, batch_rows: int = 100000) -> dict:
+    import pandas as pd
+    from generate_dataset import generate_patient_data
+    from services.ml_service import MLPredictionService
+
+    rows = generate_patient_data(num_patients=num_rows)
+    df = pd.DataFrame(generate_patient_data(num_patients=batch_rows))
+
+    start = time.perf_counter()
+    model_service = MLPredictionService(model_path=model_path)
+    load_seconds = time.perf_counter() - start
+    rule_service = MLPredictionService()
+    active = next(entry for entry in model_service.list_models() if entry["active"])
+
+    return {
+        "model_version": model_service.active_version,
+        "load_seconds": round(load_seconds, 3),
+        "holdout_accuracy": (active["metrics"] or {}).get("accuracy"),
+        "rules_accuracy": accuracy(rule_service, df),
+        "model_accuracy": accuracy(model_service, df),
+        "rules_single": time_single_rows(rule_service, rows),
+        "model_single": time_single_rows(model_service, rows),
+        "batch_rows": batch_rows,
+        "rules_batch_seconds": time_batch(rule_service, df),
+        "model_batch_seconds": time_batch(model_service, df)
+    }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python benchmarks/model_inference.py <model.joblib> [batch_rows]")
+        sys.exit(1)
+
+    batch_rows = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    result = benchmark_model_inference(sys.argv[1], batch_rows=batch_rows)
+
+    print(f"Model {result['model_version']} (memory-mapped load: {result['load_seconds']} s)")
+    print(f"  Accuracy on {result['batch_rows']} synthetic rows: rules {result['rules_accuracy']}, "
+          f"model {result['model_accuracy']} (training holdout {result['holdout_accuracy']})")
+    for name in ["rules", "model"]:
+        single = result[f"{name}_single"]
+        print(f"  {name} predict_condition: mean {single['mean_ms']} ms, "
+              f"p50 {single['p50_ms']} ms, p95 {single['p95_ms']} ms")
+    print(f"  predict_batch on {result['batch_rows']} rows: rules {result['rules_batch_seconds']} s, "
+          f"model {result['model_batch_seconds']} s")
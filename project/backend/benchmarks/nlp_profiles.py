@@ -0,0 +1,80 @@
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(os.path.dirname(BACKEND_DIR), "data")
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, DATA_DIR)
+
+
+def run_profile(profile: str, num_docs: int) -> dict:
+    from generate_dataset import generate_patient_data
+    from services.nlp_service import nlp_service
+
+    texts = [p["symptom_text"] for p in generate_patient_data(num_patients=num_docs)]
+    rss_after_load_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    nlp_service.extract_symptoms(texts[0])
+
+    latencies = []
+    for text in texts:
+        start = time.perf_counter()
+        nlp_service.extract_symptoms(text)
+        latencies.append(time.perf_counter() - start)
+
+    entity_latencies = []
+    for text in texts[:100]:
+        start = time.perf_counter()
+        nlp_service.extract_medical_entities(text)
+        entity_latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    return {
+        "profile": profile,
+        "pipeline": nlp_service.nlp.pipe_names,
+        "docs": len(texts),
+        "extract_mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+        "extract_p50_ms": round(latencies[len(latencies) // 2] * 1000, 3),
+        "extract_p95_ms": round(latencies[int(len(latencies) * 0.95)] * 1000, 3),
+        "entities_mean_ms": round(sum(entity_latencies) / len(entity_latencies) * 1000, 3),
+        "rss_after_load_mb": round(rss_after_load_mb, 1),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    }
+
+
+def benchmark_profiles(profiles, num_docs: int = 500) -> list:
+    results = []
+    for profile in profiles:
+        env = dict(os.environ, NLP_PROFILE=profile)
+        output = subprocess.run(
+            [sys.executable, __file__, "--child", profile, str(num_docs)],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return results
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        print(json.dumps(run_profile(sys.argv[2], int(sys.argv[3]))))
+        sys.exit(0)
+
+    from services.nlp_service import PIPELINE_PROFILES
+
+    num_docs = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    print(f"Benchmarking NLP pipeline profiles on {num_docs} synthetic complaints...")
+
+    for result in benchmark_profiles(PIPELINE_PROFILES.keys(), num_docs):
+        print(f"\nProfile: {result['profile']}")
+        print(f"  Pipeline: {', '.join(result['pipeline'])}")
+        print(f"  extract_symptoms: mean {result['extract_mean_ms']} ms, "
+              f"p50 {result['extract_p50_ms']} ms, p95 {result['extract_p95_ms']} ms")
+        print(f"  extract_medical_entities: mean {result['entities_mean_ms']} ms")
+        print(f"  RSS after load: {result['rss_after_load_mb']} MB, peak: {result['peak_rss_mb']} MB")
@@ -0,0 +1,55 @@
+import os
+import random
+import string
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+SAMPLE_TEXT = (
+    "I have had sharp payn in my left nee and sholder for about two weeks. "
+    "There is some swell around the ancle, pins and needle in my rist and "
+    "the doctor mentioned a possible rotator cup tear or car pal tunnel. "
+)
+
+
+def synthetic_lexicon(size: int, seed: int = 7) -> dict:
+    rng = random.Random(seed)
+    lexicon = {}
+    while len(lexicon) < size:
+        words = rng.choice([1, 1, 1, 2, 3])
+        wrong = " ".join(
+            "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9)))
+            for _ in range(words)
+        )
+        lexicon[wrong] = wrong.upper()
+    return lexicon
+
+
+def benchmark_normalizer(sizes, repeats: int = 200) -> list:
+    from services.text_normalizer import MedicalTextNormalizer
+
+    text = SAMPLE_TEXT * 10
+    results = []
+    for size in sizes:
+        normalizer = MedicalTextNormalizer(synthetic_lexicon(size))
+        normalizer.normalize(text)
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            normalizer.normalize(text)
+        elapsed = time.perf_counter() - start
+
+        results.append({
+            "lexicon_size": size,
+            "ns_per_char": round(elapsed / (repeats * len(text)) * 1e9, 1)
+        })
+    return results
+
+
+if __name__ == "__main__":
+    sizes = [int(size) for size in sys.argv[1:]] or [10, 100, 1000, 10000, 100000]
+    print(f"Normalizer cost per character ({len(SAMPLE_TEXT) * 10} chars of text):")
+    for result in benchmark_normalizer(sizes):
+        print(f"  lexicon {result['lexicon_size']:>7}: {result['ns_per_char']} ns/char")
@@ -0,0 +1,90 @@
+import json
+import os
+import re
+import resource
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    ref = re.findall(r"[a-z0-9']+", reference.lower())
+    hyp = re.findall(r"[a-z0-9']+", hypothesis.lower())
+    row = list(range(len(hyp) + 1))
+    for i in range(1, len(ref) + 1):
+        previous_row, row = row, [i] + [0] * len(hyp)
+        for j in range(1, len(hyp) + 1):
+            cost = 0 if ref[i - 1] == hyp[j - 1] else 1
+            row[j] = min(row[j - 1] + 1, previous_row[j] + 1, previous_row[j - 1] + cost)
+    return row[len(hyp)] / max(len(ref), 1)
+
+
+def run_backend(backend: str, audio_path: str, reference: str, repeats: int) -> dict:
+    import whisper
+    from services.speech_service import speech_service as service
+
+    rss_after_load_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    audio = whisper.load_audio(audio_path)
+    audio_seconds = len(audio) / whisper.audio.SAMPLE_RATE
+    service.transcribe_audio(audio)
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = service.transcribe_audio(audio)
+    elapsed = (time.perf_counter() - start) / repeats
+
+    return {
+        "backend": backend,
+        "wer": round(word_error_rate(reference, result["text"]), 3),
+        "real_time_factor": round(elapsed / audio_seconds, 3),
+        "seconds_per_run": round(elapsed, 2),
+        "rss_after_load_mb": round(rss_after_load_mb, 1),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "text": result["text"]
+    }
+
+
+def benchmark_backends(backends, audio_path: str, reference_path: str, repeats: int = 3) -> list:
+    results = []
+    for backend in backends:
+        completed = subprocess.run(
+            [sys.executable, __file__, "--child", backend, audio_path, reference_path, str(repeats)],
+            env=dict(os.environ, SPEECH_BACKEND=backend, SPEECH_VAD="false"),
+            capture_output=True,
+            text=True
+        )
+        if completed.returncode != 0:
+            results.append({"backend": backend, "error": completed.stderr.strip().splitlines()[-1]})
+            continue
+        results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+    return results
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        with open(sys.argv[4]) as f:
+            reference_text = f.read()
+        print(json.dumps(run_backend(sys.argv[2], sys.argv[3], reference_text, int(sys.argv[5]))))
+        sys.exit(0)
+
+    if len(sys.argv) < 3:
+        print("Usage: python benchmarks/speech_backends.py <audio_file> <reference_transcript.txt> "
+              "[repeats] [backend,backend,...]")
+        sys.exit(1)
+
+    repeats = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+    backends = sys.argv[4].split(",") if len(sys.argv) > 4 else ["whisper", "whisper-int8", "faster-whisper"]
+    print(f"Benchmarking speech backends on {os.path.basename(sys.argv[1])}...")
+
+    for result in benchmark_backends(backends, sys.argv[1], sys.argv[2], repeats):
+        print(f"\nBackend: {result['backend']}")
+        if "error" in result:
+            print(f"  Failed: {result['error']}")
+            continue
+        print(f"  WER: {result['wer']}")
+        print(f"  Real-time factor: {result['real_time_factor']} ({result['seconds_per_run']} s per run)")
+        print(f"  RSS after load: {result['rss_after_load_mb']} MB, peak: {result['peak_rss_mb']} MB")
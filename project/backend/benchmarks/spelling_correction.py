@@ -0,0 +1,95 @@
+import os
+import random
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(os.path.dirname(BACKEND_DIR), "data")
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, DATA_DIR)
+
+
+def misspell(word: str, rng: random.Random) -> str:
+    if len(word) < 4:
+        return word
+    i = rng.randrange(1, len(word) - 1)
+    operation = rng.choice(["delete", "transpose", "substitute"])
+    if operation == "delete":
+        return word[:i] + word[i + 1:]
+    if operation == "transpose":
+        return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    return word[:i] + rng.choice("aeiou") + word[i + 1:]
+
+
+def inject_typos(text: str, vocabulary: set, rng: random.Random, rate: float) -> str:
+    words = []
+    for word in text.split(" "):
+        stripped = word.strip(".,()").lower()
+        if stripped in vocabulary and rng.random() < rate:
+            word = word.replace(word.strip(".,()"), misspell(stripped, rng))
+        words.append(word)
+    return " ".join(words)
+
+
+def extracted_terms(extraction: dict) -> set:
+    return set(extraction["all_affected_parts"]) | set(extraction["additional_symptoms"])
+
+
+def evaluate(nlp_service, records, texts, gold_terms) -> dict:
+    extractions = nlp_service.extract_symptoms_batch(texts)
+    confidence = sum(e["extraction_confidence"] for e in extractions) / len(extractions)
+    body_part_hits = sum(
+        1 for record, e in zip(records, extractions)
+        if e["affected_body_part"] and record["affected_body_part"] in e["affected_body_part"]
+    )
+
+    true_positives = predicted = expected = 0
+    corrections = correct_corrections = 0
+    for extraction, gold in zip(extractions, gold_terms):
+        terms = extracted_terms(extraction)
+        true_positives += len(terms & gold)
+        predicted += len(terms)
+        expected += len(gold)
+        for correction in extraction["spelling_corrections"]:
+            corrections += 1
+            correct_corrections += correction["correction"] in gold
+
+    return {
+        "mean_confidence": round(confidence, 3),
+        "body_part_recall": round(body_part_hits / len(records), 3),
+        "term_precision": round(true_positives / predicted, 3) if predicted else 1.0,
+        "term_recall": round(true_positives / expected, 3) if expected else 1.0,
+        "corrections": corrections,
+        "correction_precision": round(correct_corrections / corrections, 3) if corrections else 1.0
+    }
+
+
+if __name__ == "__main__":
+    from generate_dataset import generate_patient_data
+    from services.nlp_service import nlp_service
+
+    num_records = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    typo_rate = float(sys.argv[2]) if len(sys.argv) > 2 else 0.3
+    rng = random.Random(42)
+    random.seed(42)
+
+    records = generate_patient_data(num_patients=num_records)
+    vocabulary = set(nlp_service.term_labels.keys())
+    clean_texts = [r["symptom_text"] for r in records]
+    noisy_texts = [inject_typos(t, vocabulary, rng, typo_rate) for t in clean_texts]
+
+    # Reference terms: what exact matching finds in the untouched text.
+    nlp_service.spelling_correction = False
+    gold_terms = [extracted_terms(e) for e in nlp_service.extract_symptoms_batch(clean_texts)]
+
+    print(f"Spelling correction on {num_records} synthetic complaints (typo rate {typo_rate})")
+    for label, texts in [("clean", clean_texts), ("typos", noisy_texts)]:
+        for enabled in (False, True):
+            nlp_service.spelling_correction = enabled
+            result = evaluate(nlp_service, records, texts, gold_terms)
+            print(f"  {label:5s} correction={'on ' if enabled else 'off'} "
+                  f"term_precision={result['term_precision']} "
+                  f"term_recall={result['term_recall']} "
+                  f"corrections={result['corrections']} "
+                  f"(precision {result['correction_precision']}) "
+                  f"body_part_recall={result['body_part_recall']} "
+                  f"confidence={result['mean_confidence']}")
@@ -0,0 +1,49 @@
+import os
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+
+def benchmark_vad(audio_paths) -> list:
+    import whisper
+    from services.speech_service import EnergyVAD, speech_service
+
+    vad = EnergyVAD()
+    results = []
+    for path in audio_paths:
+        audio = whisper.load_audio(path)
+
+        speech_service.vad = None
+        start = time.perf_counter()
+        speech_service.transcribe_audio(audio)
+        full_seconds = time.perf_counter() - start
+
+        speech_service.vad = vad
+        start = time.perf_counter()
+        trimmed = speech_service.transcribe_audio(audio)
+        vad_seconds = time.perf_counter() - start
+
+        results.append({
+            "file": os.path.basename(path),
+            **trimmed["vad"],
+            "full_transcribe_seconds": round(full_seconds, 2),
+            "vad_transcribe_seconds": round(vad_seconds, 2),
+            "speedup": round(full_seconds / vad_seconds, 2)
+        })
+    return results
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python benchmarks/vad_trimming.py <audio_file> [<audio_file> ...]")
+        sys.exit(1)
+
+    print("Benchmarking energy VAD trimming before Whisper...")
+    for result in benchmark_vad(sys.argv[1:]):
+        print(f"\n{result['file']}:")
+        print(f"  Audio: {result['input_seconds']} s, speech kept: {result['speech_seconds']} s, "
+              f"removed: {result['removed_seconds']} s")
+        print(f"  Transcribe: {result['full_transcribe_seconds']} s -> {result['vad_transcribe_seconds']} s "
+              f"({result['speedup']}x)")
@@ -0,0 +1,50 @@
+import os
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+
+def benchmark_batching(audio_path: str, concurrency: int = 8) -> dict:
+    import whisper
+    from services.speech_service import speech_service
+
+    audio = whisper.load_audio(audio_path)
+    audio_seconds = len(audio) / whisper.audio.SAMPLE_RATE * concurrency
+
+    speech_service.transcribe_audio(audio)
+
+    start = time.perf_counter()
+    for _ in range(concurrency):
+        speech_service.transcribe_audio(audio)
+    serial_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    speech_service.transcribe_batch([audio] * concurrency, max_batch_size=concurrency)
+    batched_seconds = time.perf_counter() - start
+
+    return {
+        "requests": concurrency,
+        "audio_seconds": round(audio_seconds, 1),
+        "serial_seconds": round(serial_seconds, 2),
+        "batched_seconds": round(batched_seconds, 2),
+        "serial_throughput": round(audio_seconds / serial_seconds, 2),
+        "batched_throughput": round(audio_seconds / batched_seconds, 2),
+        "speedup": round(serial_seconds / batched_seconds, 2)
+    }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python benchmarks/whisper_batching.py <audio_file> [concurrency]")
+        sys.exit(1)
+
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    print(f"Benchmarking Whisper serial vs batched decoding ({concurrency} concurrent requests)...")
+
+    result = benchmark_batching(sys.argv[1], concurrency)
+    print(f"  Audio processed: {result['audio_seconds']} s")
+    print(f"  Serial:  {result['serial_seconds']} s ({result['serial_throughput']} audio-s/s)")
+    print(f"  Batched: {result['batched_seconds']} s ({result['batched_throughput']} audio-s/s)")
+    print(f"  Speed-up: {result['speedup']}x")
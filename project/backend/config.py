@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+import os
 
 
 class Settings(BaseSettings):
@@ -8,7 +9,59 @@ class Settings(BaseSettings):
     supabase_service_key: str
     openai_api_key: str = ""
     model_version: str = "v1.0"
+    ml_rules_version: str = "v1.0"
+    ml_artifacts_dir: str = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "artifacts"
+    )
+    ml_registry_poll_seconds: float = 30.0
+    ml_top_k: int = 3
+    ml_shadow_version: str = ""
+    ml_shadow_max_queue: int = 1000
+    ml_shadow_batch_size: int = 100
+    ml_shadow_flush_seconds: float = 5.0
     environment: str = "development"
+    nlp_profile: str = "extraction"
+    nlp_spelling_correction: bool = True
+    nlp_common_words_path: str = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "data", "common_words.txt"
+    )
+    nlp_batch_size: int = 64
+    nlp_n_process: int = 1
+    nlp_coalesce_max_batch: int = 32
+    nlp_coalesce_max_wait_ms: float = 5.0
+    nlp_execution_mode: str = "thread"
+    nlp_workers: int = 2
+    nlp_max_queue: int = 512
+    nlp_retry_after_seconds: int = 1
+    nlp_cache_size: int = 2048
+    nlp_cache_ttl_seconds: int = 3600
+    cache_redis_url: str = ""
+    dedup_enabled: bool = True
+    dedup_threshold: float = 0.8
+    dedup_window_minutes: int = 30
+    dedup_num_perm: int = 64
+    dedup_bands: int = 16
+    speech_backend: str = "whisper"
+    speech_model_size: str = "base"
+    speech_workers: int = 2
+    speech_max_queue: int = 16
+    speech_job_ttl_seconds: int = 3600
+    speech_retry_after_seconds: int = 5
+    speech_max_upload_bytes: int = 25 * 1024 * 1024
+    speech_max_duration_seconds: int = 120
+    speech_stream_step_seconds: float = 2.0
+    speech_stream_segment_seconds: float = 15.0
+    speech_vad: bool = True
+    speech_confusions_path: str = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "data", "asr_confusions.json"
+    )
+    speech_batching: bool = False
+    speech_batch_max_size: int = 8
+    speech_batch_max_wait_ms: float = 50.0
+    speech_batch_max_files: int = 200
+    speech_batch_max_total_bytes: int = 200 * 1024 * 1024
+    speech_cache_size: int = 256
+    speech_cache_ttl_seconds: int = 86400
 
     class Config:
         env_file = ".env"
@@ -1,6 +1,10 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from routes import patients, symptoms, predictions, appointments, consultations, voice, evaluation
+from routes import patients, symptoms, predictions, appointments, consultations, voice, evaluation, model_registry
+from services.nlp_batcher import nlp_batcher
+from services.dedup_service import dedup_service
+from services.transcription_jobs import transcription_jobs
+from services.shadow_service import shadow_scorer
 
 app = FastAPI(
     title="Orthopaedic Expert System API",
@@ -23,6 +27,7 @@ app.include_router(appointments.router)
 app.include_router(consultations.router)
 app.include_router(voice.router)
 app.include_router(evaluation.router)
+app.include_router(model_registry.router)
 
 
 @app.get("/")
@@ -39,6 +44,7 @@ async def root():
             "consultations": "/consultations",
             "voice": "/voice",
             "evaluation": "/evaluation",
+            "models": "/models",
             "docs": "/docs"
         }
     }
@@ -46,7 +52,14 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "service": "orthopaedic-expert-system"}
+    return {
+        "status": "healthy",
+        "service": "orthopaedic-expert-system",
+        "nlp": nlp_batcher.stats(),
+        "dedup": dedup_service.stats(),
+        "transcription": transcription_jobs.stats(),
+        "shadow": shadow_scorer.stats()
+    }
 
 
 if __name__ == "__main__":
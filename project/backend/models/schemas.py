@@ -24,10 +24,17 @@ class SymptomInput(BaseModel):
     voice_recording_url: Optional[str] = None
 
 
+class SymptomBatchInput(BaseModel):
+    items: List[SymptomInput] = Field(..., min_length=1, max_length=1000)
+    batch_size: Optional[int] = Field(None, ge=1, le=1000)
+
+
 class SymptomExtraction(BaseModel):
     affected_body_part: Optional[str] = None
     pain_level: Optional[int] = Field(None, ge=0, le=10)
     duration: Optional[str] = None
+    duration_days: Optional[int] = Field(None, ge=0)
+    duration_category: Optional[str] = None
     additional_symptoms: List[str] = Field(default_factory=list)
     extraction_confidence: float = Field(..., ge=0, le=1)
 
@@ -35,7 +42,7 @@ class SymptomExtraction(BaseModel):
 class ConditionPrediction(BaseModel):
     condition: str
     probability: float
-    explanation: str
+    explanation: Optional[str] = None
 
 
 class PredictionResult(BaseModel):
@@ -89,6 +96,10 @@ class ConsultationLogCreate(BaseModel):
     consultation_duration: int
 
 
+class ModelActivation(BaseModel):
+    version: str
+
+
 class VoiceTranscriptionRequest(BaseModel):
     audio_file_path: str
     patient_id: str
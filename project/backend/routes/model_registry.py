@@ -0,0 +1,52 @@
+from fastapi import APIRouter, HTTPException
+from models.schemas import ModelActivation
+from services.ml_service import ml_service
+from services.shadow_service import shadow_scorer
+import asyncio
+
+router = APIRouter(prefix="/models", tags=["models"])
+
+
+def _registry_response():
+    return {
+        "active_version": ml_service.active_version,
+        "previous_version": ml_service.previous_version,
+        "models": ml_service.list_models(),
+        "load_errors": ml_service.load_errors,
+        "shadow": shadow_scorer.stats()
+    }
+
+
+@router.get("")
+async def list_models(refresh: bool = False):
+    if refresh:
+        await asyncio.to_thread(ml_service.refresh_models)
+    return _registry_response()
+
+
+@router.post("")
+async def activate_model(activation: ModelActivation):
+    try:
+        await asyncio.to_thread(ml_service.activate, activation.version)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return {
+        **_registry_response(),
+        "message": f"Model {activation.version} activated"
+    }
+
+
+@router.post("/rollback")
+async def rollback_model():
+    try:
+        version = ml_service.rollback()
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    return {
+        **_registry_response(),
+        "message": f"Rolled back to model {version}"
+    }
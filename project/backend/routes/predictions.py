@@ -1,6 +1,9 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
 from database import supabase
+from routes.symptoms import SYMPTOM_COLUMNS
 from services.ml_service import ml_service
+from services.shadow_service import shadow_scorer
 from services.recommendation_service import recommendation_service
 from config import get_settings
 
@@ -8,16 +11,52 @@ router = APIRouter(prefix="/predictions", tags=["predictions"])
 settings = get_settings()
 
 
+def _linked_prediction_response(original_symptom_id: str):
+    pred_result = supabase.table("predictions").select("*").eq("symptom_id", original_symptom_id).order("created_at", desc=True).limit(1).execute()
+
+    if not pred_result.data:
+        return None
+
+    prediction = pred_result.data[0]
+
+    rec_result = supabase.table("recommendations").select("*").eq("prediction_id", prediction["id"]).limit(1).execute()
+    appt_result = supabase.table("appointments").select("*").eq("prediction_id", prediction["id"]).limit(1).execute()
+
+    return {
+        "prediction_id": prediction["id"],
+        "predictions": prediction["predicted_conditions"],
+        "severity": {
+            "level": prediction["severity_level"],
+            "score": prediction["severity_score"]
+        },
+        "recommendations": rec_result.data[0] if rec_result.data else None,
+        "appointment": {
+            "id": appt_result.data[0]["id"] if appt_result.data else None,
+            "priority_score": appt_result.data[0]["priority_score"] if appt_result.data else None
+        },
+        "duplicate_of": original_symptom_id,
+        "message": "Near-duplicate submission linked to existing prediction"
+    }
+
+
 @router.post("/predict/{symptom_id}")
-async def predict_condition(symptom_id: str):
+async def predict_condition(
+    symptom_id: str,
+    top_k: int = Query(settings.ml_top_k, ge=1, le=10)
+):
     try:
-        symptom_result = supabase.table("symptoms").select("*").eq("id", symptom_id).maybeSingle().execute()
+        symptom_result = supabase.table("symptoms").select(SYMPTOM_COLUMNS).eq("id", symptom_id).maybeSingle().execute()
 
         if not symptom_result.data:
             raise HTTPException(status_code=404, detail="Symptom record not found")
 
         symptom_data = symptom_result.data
 
+        if symptom_data.get("duplicate_of"):
+            linked = _linked_prediction_response(symptom_data["duplicate_of"])
+            if linked:
+                return linked
+
         patient_result = supabase.table("patients").select("*").eq("id", symptom_data["patient_id"]).maybeSingle().execute()
 
         if not patient_result.data:
@@ -25,7 +64,11 @@ async def predict_condition(symptom_id: str):
 
         patient_data = patient_result.data
 
-        predictions, features = ml_service.predict_condition(symptom_data)
+        predictions, features = ml_service.predict_condition(
+            symptom_data,
+            age=patient_data["age"],
+            top_k=top_k
+        )
 
         severity_level, severity_score = ml_service.predict_severity(symptom_data)
 
@@ -37,7 +80,7 @@ async def predict_condition(symptom_id: str):
             "top_condition_probability": predictions[0]["probability"],
             "severity_level": severity_level,
             "severity_score": severity_score,
-            "model_version": settings.model_version,
+            "model_version": features["model_version"],
             "features_used": features
         }
 
@@ -48,6 +91,14 @@ async def predict_condition(symptom_id: str):
 
         prediction_id = pred_result.data[0]["id"]
 
+        shadow_scorer.submit(
+            prediction_id,
+            symptom_data,
+            patient_data["age"],
+            features["model_version"],
+            predictions[0]["condition"]
+        )
+
         recommendations = recommendation_service.generate_recommendations(
             predictions[0]["condition"],
             severity_level,
@@ -64,7 +115,7 @@ async def predict_condition(symptom_id: str):
         priority_score = ml_service.calculate_priority_score(
             severity_score,
             symptom_data.get("pain_level", 5),
-            symptom_data.get("duration", ""),
+            features["duration_days"],
             patient_data["age"]
         )
 
@@ -112,6 +163,29 @@ async def get_prediction(prediction_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/{prediction_id}/explanations")
+async def get_prediction_explanations(prediction_id: str, condition: Optional[str] = None):
+    try:
+        result = supabase.table("predictions").select("id, symptom_id, predicted_conditions").eq("id", prediction_id).maybeSingle().execute()
+
+        if not result.data:
+            raise HTTPException(status_code=404, detail="Prediction not found")
+
+        symptom_result = supabase.table("symptoms").select("affected_body_part, pain_level").eq("id", result.data["symptom_id"]).maybeSingle().execute()
+
+        predictions = result.data["predicted_conditions"]
+        if condition:
+            predictions = [p for p in predictions if p["condition"] == condition]
+
+        return {
+            "prediction_id": prediction_id,
+            "explanations": ml_service.explain_predictions(predictions, symptom_result.data or {})
+        }
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/patient/{patient_id}")
 async def get_patient_predictions(patient_id: str):
     try:
@@ -1,39 +1,215 @@
+import uuid
 from fastapi import APIRouter, HTTPException
-from models.schemas import SymptomInput
+from models.schemas import SymptomInput, SymptomBatchInput
 from database import supabase
-from services.nlp_service import nlp_service
+from services.nlp_batcher import nlp_batcher, NLPQueueFullError
+from services.dedup_service import dedup_service, laterality
+from config import get_settings
 
 router = APIRouter(prefix="/symptoms", tags=["symptoms"])
+settings = get_settings()
+
+# Everything except doc_bin: the serialised spaCy doc is only read by
+# /reprocess and would add a large base64 blob to every API read.
+SYMPTOM_COLUMNS = (
+    "id, patient_id, symptom_text, processed_text, affected_body_part, pain_level, "
+    "duration, duration_days, duration_category, additional_symptoms, voice_recording_url, "
+    "extraction_confidence, duplicate_of, created_at"
+)
+
+
+def _build_symptom_record(symptom_input: SymptomInput, analysis: dict) -> dict:
+    extraction_result = analysis["extraction"]
+    return {
+        "patient_id": symptom_input.patient_id,
+        "symptom_text": symptom_input.symptom_text,
+        "processed_text": extraction_result["processed_text"],
+        "affected_body_part": extraction_result["affected_body_part"],
+        "pain_level": extraction_result["pain_level"],
+        "duration": extraction_result["duration"],
+        "duration_days": extraction_result["duration_days"],
+        "duration_category": extraction_result["duration_category"],
+        "additional_symptoms": extraction_result["additional_symptoms"],
+        "voice_recording_url": symptom_input.voice_recording_url,
+        "extraction_confidence": extraction_result["extraction_confidence"],
+        "doc_bin": analysis["doc_bin"]
+    }
+
+
+def _dedup_scope(patient_id: str, extraction: dict) -> tuple:
+    # Similar wording is not enough: a resubmission whose body part, side, pain
+    # level or duration changed is new clinical information and must get its
+    # own prediction and priority.
+    return (
+        patient_id,
+        extraction["affected_body_part"],
+        laterality(extraction["processed_text"]),
+        extraction["pain_level"],
+        extraction["duration_days"]
+    )
+
+
+def _check_duplicate(scope: tuple, processed_text: str):
+    if not settings.dedup_enabled:
+        return None, None
+    signature = dedup_service.signature(processed_text)
+    return signature, dedup_service.find_duplicate(scope, signature)
+
+
+def _index_symptom(scope: tuple, symptom_id: str, signature, duplicate):
+    if signature is not None and duplicate is None:
+        dedup_service.add(scope, symptom_id, signature)
+
+
+def _analysis_response(analysis: dict, include_entities: bool) -> dict:
+    response = {"extraction": analysis["extraction"]}
+    if include_entities:
+        response["entities"] = analysis["entities"]
+    return response
 
 
 @router.post("/extract")
-async def extract_symptoms(symptom_input: SymptomInput):
+async def extract_symptoms(symptom_input: SymptomInput, include_entities: bool = False):
     try:
-        extraction_result = nlp_service.extract_symptoms(symptom_input.symptom_text)
-
-        symptom_record = {
-            "patient_id": symptom_input.patient_id,
-            "symptom_text": symptom_input.symptom_text,
-            "processed_text": extraction_result["processed_text"],
-            "affected_body_part": extraction_result["affected_body_part"],
-            "pain_level": extraction_result["pain_level"],
-            "duration": extraction_result["duration"],
-            "additional_symptoms": extraction_result["additional_symptoms"],
-            "voice_recording_url": symptom_input.voice_recording_url,
-            "extraction_confidence": extraction_result["extraction_confidence"]
-        }
+        analysis = await nlp_batcher.analyze(symptom_input.symptom_text, include_entities)
+
+        symptom_record = _build_symptom_record(symptom_input, analysis)
+
+        scope = _dedup_scope(symptom_input.patient_id, analysis["extraction"])
+        signature, duplicate = _check_duplicate(scope, analysis["extraction"]["processed_text"])
+        symptom_record["duplicate_of"] = duplicate["symptom_id"] if duplicate else None
 
         result = supabase.table("symptoms").insert(symptom_record).execute()
 
         if not result.data:
             raise HTTPException(status_code=500, detail="Failed to save symptom data")
 
+        symptom_id = result.data[0]["id"]
+        _index_symptom(scope, symptom_id, signature, duplicate)
+
         return {
-            "symptom_id": result.data[0]["id"],
-            "extraction": extraction_result,
+            "symptom_id": symptom_id,
+            **_analysis_response(analysis, include_entities),
+            "duplicate": duplicate,
             "message": "Symptoms extracted and saved successfully"
         }
 
+    except NLPQueueFullError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)}
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/extract/batch")
+async def extract_symptoms_batch(batch_input: SymptomBatchInput, include_entities: bool = False):
+    try:
+        analyses = await nlp_batcher.analyze_batch(
+            [item.symptom_text for item in batch_input.items],
+            with_entities=include_entities,
+            batch_size=batch_input.batch_size or settings.nlp_batch_size,
+            n_process=settings.nlp_n_process
+        )
+
+        symptom_records = []
+        duplicate_checks = []
+        batch_signatures = {}
+        for item, analysis in zip(batch_input.items, analyses):
+            symptom_record = _build_symptom_record(item, analysis)
+            # Ids are assigned up front so repeats within this batch can link to
+            # an earlier item before anything has been inserted or indexed.
+            symptom_record["id"] = str(uuid.uuid4())
+            scope = _dedup_scope(item.patient_id, analysis["extraction"])
+            signature, duplicate = _check_duplicate(scope, analysis["extraction"]["processed_text"])
+            if signature is not None:
+                earlier = batch_signatures.setdefault(scope, [])
+                if duplicate is None:
+                    duplicate = dedup_service.best_match(signature, earlier)
+                if duplicate is None:
+                    earlier.append((symptom_record["id"], signature))
+            symptom_record["duplicate_of"] = duplicate["symptom_id"] if duplicate else None
+            symptom_records.append(symptom_record)
+            duplicate_checks.append((scope, signature, duplicate))
+
+        result = supabase.table("symptoms").insert(symptom_records).execute()
+
+        if not result.data or len(result.data) != len(symptom_records):
+            raise HTTPException(status_code=500, detail="Failed to save symptom data")
+
+        for row, (scope, signature, duplicate) in zip(result.data, duplicate_checks):
+            _index_symptom(scope, row["id"], signature, duplicate)
+
+        return {
+            "results": [
+                {
+                    "symptom_id": row["id"],
+                    **_analysis_response(analysis, include_entities),
+                    "duplicate": duplicate
+                }
+                for row, analysis, (_, _, duplicate) in zip(result.data, analyses, duplicate_checks)
+            ],
+            "count": len(result.data),
+            "message": "Symptoms extracted and saved successfully"
+        }
+
+    except NLPQueueFullError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)}
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/reprocess")
+async def reprocess_symptoms(limit: int = 500, offset: int = 0):
+    try:
+        rows = supabase.table("symptoms").select(
+            "id, patient_id, symptom_text, doc_bin"
+        ).not_.is_("doc_bin", "null").order("created_at").range(offset, offset + limit - 1).execute().data
+
+        if not rows:
+            return {"count": 0, "message": "No stored documents to reprocess"}
+
+        extraction_results = await nlp_batcher.reextract_batch(
+            [(row["doc_bin"], row["symptom_text"]) for row in rows]
+        )
+
+        updates = [
+            {
+                "id": row["id"],
+                "patient_id": row["patient_id"],
+                "symptom_text": row["symptom_text"],
+                "processed_text": extraction_result["processed_text"],
+                "affected_body_part": extraction_result["affected_body_part"],
+                "pain_level": extraction_result["pain_level"],
+                "duration": extraction_result["duration"],
+                "duration_days": extraction_result["duration_days"],
+                "duration_category": extraction_result["duration_category"],
+                "additional_symptoms": extraction_result["additional_symptoms"],
+                "extraction_confidence": extraction_result["extraction_confidence"]
+            }
+            for row, extraction_result in zip(rows, extraction_results)
+        ]
+
+        supabase.table("symptoms").upsert(updates).execute()
+
+        return {
+            "count": len(updates),
+            "next_offset": offset + len(updates),
+            "message": "Symptoms reprocessed from stored documents"
+        }
+
+    except NLPQueueFullError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)}
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -41,7 +217,7 @@ async def extract_symptoms(symptom_input: SymptomInput):
 @router.get("/{symptom_id}")
 async def get_symptom(symptom_id: str):
     try:
-        result = supabase.table("symptoms").select("*").eq("id", symptom_id).maybeSingle().execute()
+        result = supabase.table("symptoms").select(SYMPTOM_COLUMNS).eq("id", symptom_id).maybeSingle().execute()
 
         if not result.data:
             raise HTTPException(status_code=404, detail="Symptom record not found")
@@ -55,7 +231,7 @@ async def get_symptom(symptom_id: str):
 @router.get("/patient/{patient_id}")
 async def get_patient_symptoms(patient_id: str):
     try:
-        result = supabase.table("symptoms").select("*").eq("patient_id", patient_id).order("created_at", desc=True).execute()
+        result = supabase.table("symptoms").select(SYMPTOM_COLUMNS).eq("patient_id", patient_id).order("created_at", desc=True).execute()
 
         return {"symptoms": result.data, "count": len(result.data)}
 
@@ -1,40 +1,68 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Form
-from services.speech_service import speech_service
-import os
-import uuid
+from fastapi import APIRouter, UploadFile, File, HTTPException, Form, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from typing import List
+from services.transcription_jobs import transcription_jobs, TranscriptionQueueFullError
+from services.audio_decoder import (
+    AudioDecodeError,
+    AudioTooLargeError,
+    StreamingAudioDecoder,
+    decode_audio_stream,
+    iter_bytes,
+    iter_upload
+)
+from services.streaming_transcription import StreamingTranscriptionSession
+from services.nlp_batcher import nlp_batcher
+from config import get_settings
+import asyncio
+import json
 
 router = APIRouter(prefix="/voice", tags=["voice"])
+settings = get_settings()
 
 
-@router.post("/transcribe")
-async def transcribe_audio(
-    audio: UploadFile = File(...),
-    patient_id: str = Form(...)
-):
+async def _decode_upload(audio: UploadFile):
     try:
-        temp_dir = "/tmp/audio_uploads"
-        os.makedirs(temp_dir, exist_ok=True)
+        return await decode_audio_stream(
+            iter_upload(audio),
+            max_bytes=settings.speech_max_upload_bytes,
+            max_seconds=settings.speech_max_duration_seconds
+        )
+    except AudioTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except AudioDecodeError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-        file_extension = audio.filename.split(".")[-1] if audio.filename else "wav"
-        temp_filename = f"{uuid.uuid4()}.{file_extension}"
-        temp_path = os.path.join(temp_dir, temp_filename)
 
-        with open(temp_path, "wb") as buffer:
-            content = await audio.read()
-            buffer.write(content)
+# Hashes the audio for the cache key and may call Redis, so async routes run
+# it through asyncio.to_thread rather than on the event loop.
+def _submit_transcription(audio, patient_id: str = None):
+    try:
+        if patient_id is None:
+            return None, transcription_jobs.run(audio)
+        return transcription_jobs.submit(audio, patient_id)
+    except TranscriptionQueueFullError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)}
+        )
 
-        transcription_result = speech_service.transcribe_audio(temp_path)
 
-        normalized_text = speech_service.normalize_medical_text(
-            transcription_result["text"]
-        )
+@router.post("/transcribe")
+async def transcribe_audio(
+    audio: UploadFile = File(...),
+    patient_id: str = Form(...)
+):
+    audio_array = await _decode_upload(audio)
+    _, future = await asyncio.to_thread(_submit_transcription, audio_array)
 
-        os.remove(temp_path)
+    try:
+        transcription_result = await asyncio.wrap_future(future)
 
         return {
             "patient_id": patient_id,
             "original_text": transcription_result["text"],
-            "normalized_text": normalized_text,
+            "normalized_text": transcription_result["normalized_text"],
             "language": transcription_result["language"],
             "message": "Audio transcribed successfully"
         }
@@ -43,3 +71,180 @@ async def transcribe_audio(
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
+
+
+async def _transcribe_batch_item(
+    index: int,
+    filename: str,
+    data: bytes,
+    language: str,
+    extract_symptoms: bool,
+    semaphore: asyncio.Semaphore
+) -> dict:
+    item = {"index": index, "filename": filename}
+
+    async with semaphore:
+        try:
+            audio_array = await decode_audio_stream(
+                iter_bytes(data),
+                max_bytes=settings.speech_max_upload_bytes,
+                max_seconds=settings.speech_max_duration_seconds
+            )
+
+            while True:
+                try:
+                    future = await asyncio.to_thread(transcription_jobs.run, audio_array, language)
+                    break
+                except TranscriptionQueueFullError as e:
+                    await asyncio.sleep(e.retry_after)
+
+            transcription_result = await asyncio.wrap_future(future)
+            item.update({
+                "status": "completed",
+                "original_text": transcription_result["text"],
+                "normalized_text": transcription_result["normalized_text"],
+                "language": transcription_result["language"]
+            })
+
+            if extract_symptoms:
+                analysis = await nlp_batcher.analyze(transcription_result["normalized_text"])
+                item["extraction"] = analysis["extraction"]
+
+        except Exception as e:
+            item.update({"status": "failed", "error": str(e)})
+
+    return item
+
+
+@router.post("/transcribe/batch")
+async def transcribe_audio_batch(
+    audios: List[UploadFile] = File(...),
+    language: str = Form("en"),
+    extract_symptoms: bool = Form(True)
+):
+    if len(audios) > settings.speech_batch_max_files:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {settings.speech_batch_max_files} files per batch"
+        )
+
+    uploads = []
+    remaining = settings.speech_batch_max_total_bytes
+    for audio in audios:
+        limit = min(settings.speech_max_upload_bytes, remaining)
+        data = await audio.read(limit + 1)
+        if len(data) > settings.speech_max_upload_bytes:
+            raise HTTPException(
+                status_code=413,
+                detail=f"{audio.filename} exceeds {settings.speech_max_upload_bytes} bytes"
+            )
+        if len(data) > remaining:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Batch exceeds {settings.speech_batch_max_total_bytes} bytes in total"
+            )
+        remaining -= len(data)
+        uploads.append((audio.filename, data))
+
+    semaphore = asyncio.Semaphore(max(settings.speech_workers * 2, 1))
+
+    async def results():
+        tasks = [
+            asyncio.ensure_future(_transcribe_batch_item(
+                index, filename, data, language, extract_symptoms, semaphore
+            ))
+            for index, (filename, data) in enumerate(uploads)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield json.dumps(await next_done) + "\n"
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(results(), media_type="application/x-ndjson")
+
+
+@router.post("/jobs")
+async def create_transcription_job(
+    audio: UploadFile = File(...),
+    patient_id: str = Form(...)
+):
+    audio_array = await _decode_upload(audio)
+    job_id, _ = await asyncio.to_thread(_submit_transcription, audio_array, patient_id)
+
+    return {
+        "job_id": job_id,
+        "patient_id": patient_id,
+        "status": "queued",
+        "message": "Transcription job queued"
+    }
+
+
+@router.get("/jobs/{job_id}")
+async def get_transcription_job(job_id: str):
+    job = transcription_jobs.get(job_id)
+
+    if job is None:
+        raise HTTPException(status_code=404, detail="Transcription job not found")
+
+    return job
+
+
+@router.websocket("/stream")
+async def stream_transcription(
+    websocket: WebSocket,
+    encoding: str = "container",
+    language: str = "en"
+):
+    await websocket.accept()
+
+    try:
+        decoder = StreamingAudioDecoder(encoding, settings.speech_max_duration_seconds)
+    except ValueError as e:
+        await websocket.send_json({"type": "error", "detail": str(e)})
+        await websocket.close(code=1003)
+        return
+
+    async def transcribe(audio):
+        return await asyncio.wrap_future(transcription_jobs.run(audio, language, use_cache=False))
+
+    session = StreamingTranscriptionSession(
+        decoder,
+        transcribe,
+        websocket.send_json,
+        step_seconds=settings.speech_stream_step_seconds,
+        segment_seconds=settings.speech_stream_segment_seconds
+    )
+
+    async def receive_audio():
+        try:
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                if message.get("bytes"):
+                    await decoder.feed(message["bytes"])
+                elif message.get("text") == "end":
+                    break
+        finally:
+            await decoder.close()
+            session.input_finished.set()
+
+    await decoder.start()
+    receiver = asyncio.ensure_future(receive_audio())
+
+    try:
+        await session.run()
+        await receiver
+        await websocket.close()
+    except WebSocketDisconnect:
+        receiver.cancel()
+    except (AudioTooLargeError, AudioDecodeError, TranscriptionQueueFullError) as e:
+        receiver.cancel()
+        await websocket.send_json({"type": "error", "detail": str(e)})
+        await websocket.close(code=1009 if isinstance(e, AudioTooLargeError) else 1011)
+    except Exception as e:
+        receiver.cancel()
+        await websocket.send_json({"type": "error", "detail": f"Transcription failed: {str(e)}"})
+        await websocket.close(code=1011)
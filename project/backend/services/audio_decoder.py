@@ -0,0 +1,167 @@
+import asyncio
+import numpy as np
+from typing import AsyncIterator
+
+
+SAMPLE_RATE = 16000
+CHUNK_SIZE = 64 * 1024
+
+
+class AudioTooLargeError(Exception):
+    pass
+
+
+class AudioDecodeError(Exception):
+    pass
+
+
+async def decode_audio_stream(
+    chunks: AsyncIterator[bytes],
+    max_bytes: int,
+    max_seconds: float
+) -> np.ndarray:
+    process = await asyncio.create_subprocess_exec(
+        "ffmpeg", "-loglevel", "error",
+        "-i", "pipe:0",
+        "-f", "s16le", "-acodec", "pcm_s16le",
+        "-ac", "1", "-ar", str(SAMPLE_RATE),
+        "pipe:1",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+
+    max_pcm_bytes = int(max_seconds * SAMPLE_RATE) * 2
+
+    async def feed():
+        received = 0
+        try:
+            async for chunk in chunks:
+                received += len(chunk)
+                if received > max_bytes:
+                    raise AudioTooLargeError(f"Audio upload exceeds {max_bytes} bytes")
+                process.stdin.write(chunk)
+                await process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            if not process.stdin.is_closing():
+                process.stdin.close()
+
+    async def collect() -> bytearray:
+        pcm = bytearray()
+        while True:
+            block = await process.stdout.read(CHUNK_SIZE)
+            if not block:
+                return pcm
+            pcm.extend(block)
+            if len(pcm) > max_pcm_bytes:
+                raise AudioTooLargeError(f"Audio exceeds {max_seconds} seconds")
+
+    feeder = asyncio.ensure_future(feed())
+    try:
+        pcm = await collect()
+        await feeder
+    except BaseException:
+        feeder.cancel()
+        if process.returncode is None:
+            process.kill()
+        await process.wait()
+        raise
+
+    stderr = await process.stderr.read()
+    if await process.wait() != 0:
+        raise AudioDecodeError(f"Could not decode audio: {stderr.decode(errors='ignore').strip()}")
+
+    return np.frombuffer(bytes(pcm), dtype=np.int16).astype(np.float32) / 32768.0
+
+
+async def iter_upload(upload, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+    while True:
+        chunk = await upload.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+class StreamingAudioDecoder:
+    def __init__(self, encoding: str = "container", max_seconds: float = 120.0):
+        if encoding not in ("container", "pcm_s16le"):
+            raise ValueError(f"Unknown audio encoding: {encoding}")
+        self.encoding = encoding
+        self.max_pcm_bytes = int(max_seconds * SAMPLE_RATE) * 2
+        self.max_seconds = max_seconds
+        self._pcm = bytearray()
+        self._total_bytes = 0
+        self._process = None
+        self._reader = None
+
+    async def start(self):
+        if self.encoding == "pcm_s16le":
+            return
+
+        self._process = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-loglevel", "error",
+            "-i", "pipe:0",
+            "-f", "s16le", "-acodec", "pcm_s16le",
+            "-ac", "1", "-ar", str(SAMPLE_RATE),
+            "pipe:1",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        self._reader = asyncio.ensure_future(self._read_stdout())
+
+    async def _read_stdout(self):
+        while True:
+            block = await self._process.stdout.read(CHUNK_SIZE)
+            if not block:
+                return
+            self._append_pcm(block)
+
+    def _append_pcm(self, block: bytes):
+        self._total_bytes += len(block)
+        if self._total_bytes > self.max_pcm_bytes:
+            raise AudioTooLargeError(f"Audio exceeds {self.max_seconds} seconds")
+        self._pcm.extend(block)
+
+    async def feed(self, chunk: bytes):
+        if self._reader is not None and self._reader.done():
+            self._reader.result()
+
+        if self._process is None:
+            self._append_pcm(chunk)
+            return
+
+        try:
+            self._process.stdin.write(chunk)
+            await self._process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            raise AudioDecodeError("Audio decoder stopped accepting input")
+
+    def take_samples(self) -> np.ndarray:
+        if self._reader is not None and self._reader.done():
+            self._reader.result()
+
+        usable = len(self._pcm) - len(self._pcm) % 2
+        block = bytes(self._pcm[:usable])
+        del self._pcm[:usable]
+        return np.frombuffer(block, dtype=np.int16).astype(np.float32) / 32768.0
+
+    async def close(self):
+        if self._process is None:
+            return
+
+        if not self._process.stdin.is_closing():
+            self._process.stdin.close()
+        try:
+            await self._reader
+        finally:
+            if self._process.returncode is None:
+                self._process.kill()
+            await self._process.wait()
+
+
+async def iter_bytes(data: bytes, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+    for offset in range(0, len(data), chunk_size):
+        yield data[offset:offset + chunk_size]
@@ -0,0 +1,100 @@
+import numpy as np
+import threading
+from functools import partial
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Tuple
+from services.audio_decoder import SAMPLE_RATE
+
+
+class WhisperBatchScheduler:
+    def __init__(
+        self,
+        executor,
+        worker: Callable,
+        max_batch_size: int = 8,
+        max_wait_ms: float = 50.0
+    ):
+        self.executor = executor
+        self.worker = worker
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._pending: Dict[str, List[Tuple[np.ndarray, Future]]] = {}
+        self._pending_segments: Dict[str, int] = {}
+        self._timers: Dict[str, threading.Timer] = {}
+        self._lock = threading.Lock()
+
+    def _segment_count(self, audio: np.ndarray) -> int:
+        return max(-(-len(audio) // (30 * SAMPLE_RATE)), 1)
+
+    def submit(self, audio: np.ndarray, language: str = "en") -> Future:
+        future = Future()
+        with self._lock:
+            self._pending.setdefault(language, []).append((audio, future))
+            self._pending_segments[language] = (
+                self._pending_segments.get(language, 0) + self._segment_count(audio)
+            )
+
+            if self._pending_segments[language] >= self.max_batch_size:
+                batch = self._take(language)
+            else:
+                batch = None
+                if language not in self._timers:
+                    timer = threading.Timer(self.max_wait, self._flush, args=(language,))
+                    timer.daemon = True
+                    self._timers[language] = timer
+                    timer.start()
+
+        if batch:
+            self._dispatch(batch, language)
+        return future
+
+    def _take(self, language: str) -> List[Tuple[np.ndarray, Future]]:
+        timer = self._timers.pop(language, None)
+        if timer is not None:
+            timer.cancel()
+        self._pending_segments.pop(language, None)
+        return self._pending.pop(language, [])
+
+    def _flush(self, language: str):
+        with self._lock:
+            batch = self._take(language)
+        if batch:
+            self._dispatch(batch, language)
+
+    def _dispatch(self, batch: List[Tuple[np.ndarray, Future]], language: str):
+        # Callers may cancel while a request waits for its batch; those must
+        # not be transcribed, and set_result on them would raise.
+        batch = [
+            (audio, future) for audio, future in batch
+            if future.set_running_or_notify_cancel()
+        ]
+        if not batch:
+            return
+
+        futures = [future for _, future in batch]
+        try:
+            batch_future = self.executor.submit(
+                self.worker,
+                [audio for audio, _ in batch],
+                language,
+                self.max_batch_size
+            )
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+            return
+        batch_future.add_done_callback(partial(self._resolve, futures))
+
+    def _resolve(self, futures: List[Future], batch_future: Future):
+        error = batch_future.exception()
+        if error is not None:
+            for future in futures:
+                if future.cancelled():
+                    continue
+                future.set_exception(error)
+            return
+
+        for future, result in zip(futures, batch_future.result()):
+            if future.cancelled():
+                continue
+            future.set_result(result)
@@ -0,0 +1,174 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+def content_key(*parts: Any) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, bytes):
+            digest.update(part)
+        else:
+            digest.update(str(part).encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class LRUCache:
+    # Lookups are in-process and cheap enough to run on the event loop.
+    blocking = False
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 3600.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict:
+        total = self.hits + self.misses
+        return {
+            "backend": "memory",
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0
+        }
+
+
+class RedisCache:
+    # Every call is a network round trip; async callers run it off the loop.
+    blocking = True
+
+    def __init__(
+        self,
+        redis_url: str,
+        namespace: str,
+        ttl_seconds: float = 3600.0,
+        max_size: int = 1024,
+        timeout_seconds: float = 0.25,
+        client=None
+    ):
+        if client is None:
+            import redis
+
+            client = redis.Redis.from_url(
+                redis_url,
+                socket_timeout=timeout_seconds,
+                socket_connect_timeout=timeout_seconds
+            )
+
+        self.client = client
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        # Sorted set of this namespace's keys scored by last access, used to
+        # evict least-recently-used entries beyond max_size.
+        self._index = f"{namespace}:__lru__"
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def _name(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _failed(self, operation: str, error: Exception):
+        # The cache is an optimisation: an outage degrades to misses, never
+        # to failed requests.
+        self.errors += 1
+        logger.warning("Redis cache %s failed in %s: %s", operation, self.namespace, error)
+
+    def get(self, key: str) -> Optional[Any]:
+        name = self._name(key)
+        try:
+            pipe = self.client.pipeline()
+            pipe.get(name)
+            pipe.zadd(self._index, {name: time.time()}, xx=True)
+            raw, _ = pipe.execute()
+        except Exception as e:
+            self._failed("get", e)
+            raw = None
+
+        if raw is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return json.loads(raw)
+
+    def set(self, key: str, value: Any):
+        name = self._name(key)
+        try:
+            pipe = self.client.pipeline()
+            pipe.set(name, json.dumps(value), ex=int(self.ttl_seconds))
+            pipe.zadd(self._index, {name: time.time()})
+            pipe.zcard(self._index)
+            *_, size = pipe.execute()
+
+            if size > self.max_size:
+                evicted = [member for member, _ in self.client.zpopmin(self._index, size - self.max_size)]
+                if evicted:
+                    self.client.delete(*evicted)
+        except Exception as e:
+            self._failed("set", e)
+
+    def stats(self) -> Dict:
+        total = self.hits + self.misses
+        try:
+            size = self.client.zcard(self._index)
+        except Exception:
+            size = None
+        return {
+            "backend": "redis",
+            "namespace": self.namespace,
+            "size": size,
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0
+        }
+
+
+def create_cache(
+    namespace: str,
+    max_size: int = 1024,
+    ttl_seconds: float = 3600.0,
+    redis_url: str = ""
+):
+    if redis_url:
+        return RedisCache(redis_url, namespace, ttl_seconds, max_size)
+    return LRUCache(max_size, ttl_seconds)
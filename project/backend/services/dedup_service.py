@@ -0,0 +1,134 @@
+import numpy as np
+import re
+import threading
+import time
+import zlib
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+from config import get_settings
+
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_LATERALITY_PATTERN = re.compile(r"\b(left|right|both|bilateral)\b")
+
+
+def laterality(text: str) -> Tuple[str, ...]:
+    return tuple(sorted(set(_LATERALITY_PATTERN.findall(text.lower()))))
+
+
+class MinHashLSHIndex:
+    def __init__(
+        self,
+        num_perm: int = 64,
+        bands: int = 16,
+        threshold: float = 0.8,
+        window_seconds: float = 1800.0,
+        shingle_size: int = 4
+    ):
+        if num_perm % bands != 0:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.window_seconds = window_seconds
+        self.shingle_size = shingle_size
+
+        rng = np.random.RandomState(1)
+        self._a = rng.randint(1, _MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, _MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+
+        # Buckets are keyed by a caller-defined scope (patient plus extracted
+        # fields), so only submissions within the same scope are compared.
+        self._buckets: Dict[Tuple[Hashable, int, bytes], List[str]] = {}
+        self._entries: Dict[str, Dict] = {}
+        self._expiry = deque()
+        self._lock = threading.Lock()
+
+    def signature(self, text: str) -> np.ndarray:
+        normalized = " ".join(text.lower().split())
+        k = self.shingle_size
+        shingles = {normalized[i:i + k] for i in range(max(len(normalized) - k + 1, 1))}
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles)
+        )
+        return ((np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME).min(axis=0)
+
+    def _band_keys(self, scope: Hashable, signature: np.ndarray) -> List[Tuple[Hashable, int, bytes]]:
+        return [
+            (scope, band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+    def _prune(self, now: float):
+        while self._expiry and self._expiry[0][0] < now:
+            _, symptom_id = self._expiry.popleft()
+            entry = self._entries.pop(symptom_id, None)
+            if entry is None:
+                continue
+            for key in entry["keys"]:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    continue
+                if symptom_id in bucket:
+                    bucket.remove(symptom_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def find_duplicate(self, scope: Hashable, signature: np.ndarray) -> Optional[Dict]:
+        with self._lock:
+            self._prune(time.monotonic())
+
+            candidates = set()
+            for key in self._band_keys(scope, signature):
+                candidates.update(self._buckets.get(key, ()))
+
+            return self.best_match(
+                signature,
+                ((symptom_id, self._entries[symptom_id]["signature"]) for symptom_id in candidates)
+            )
+
+    def best_match(
+        self,
+        signature: np.ndarray,
+        candidates: Iterable[Tuple[str, np.ndarray]]
+    ) -> Optional[Dict]:
+        best = None
+        for symptom_id, other in candidates:
+            similarity = float(np.mean(other == signature))
+            if similarity >= self.threshold and (best is None or similarity > best["similarity"]):
+                best = {"symptom_id": symptom_id, "similarity": round(similarity, 3)}
+
+        return best
+
+    def add(self, scope: Hashable, symptom_id: str, signature: np.ndarray):
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+
+            keys = self._band_keys(scope, signature)
+            for key in keys:
+                self._buckets.setdefault(key, []).append(symptom_id)
+
+            self._entries[symptom_id] = {"signature": signature, "keys": keys}
+            self._expiry.append((now + self.window_seconds, symptom_id))
+
+    def stats(self) -> Dict:
+        return {
+            "entries": len(self._entries),
+            "buckets": len(self._buckets),
+            "threshold": self.threshold,
+            "window_seconds": self.window_seconds
+        }
+
+
+settings = get_settings()
+dedup_service = MinHashLSHIndex(
+    num_perm=settings.dedup_num_perm,
+    bands=settings.dedup_bands,
+    threshold=settings.dedup_threshold,
+    window_seconds=settings.dedup_window_minutes * 60
+)
@@ -0,0 +1,39 @@
+import re
+from typing import Optional
+
+
+DURATION_PATTERN = re.compile(
+    r'(\d+)\s*(day|days|week|weeks|month|months|year|years)',
+    re.IGNORECASE
+)
+
+DURATION_UNIT_DAYS = {
+    "day": 1,
+    "week": 7,
+    "month": 30,
+    "year": 365,
+}
+
+
+def duration_match_to_days(match) -> int:
+    unit = match.group(2).lower().rstrip("s")
+    return int(match.group(1)) * DURATION_UNIT_DAYS[unit]
+
+
+def parse_duration_days(duration: Optional[str]) -> Optional[int]:
+    if not duration:
+        return None
+    match = DURATION_PATTERN.search(duration)
+    if not match:
+        return None
+    return duration_match_to_days(match)
+
+
+def categorize_duration_days(duration_days: Optional[int]) -> str:
+    if duration_days is None:
+        return "unknown"
+    if duration_days >= 365:
+        return "chronic"
+    if duration_days >= 30:
+        return "subacute"
+    return "acute"
@@ -1,12 +1,25 @@
 import numpy as np
-from typing import Dict, List, Tuple
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
 import joblib
 import os
+import threading
 from datetime import datetime
+from services.duration_utils import categorize_duration_days, parse_duration_days
+from config import get_settings
+
+
+ACTIVE_VERSION_FILE = "ACTIVE"
 
 
 class MLPredictionService:
-    def __init__(self):
+    def __init__(
+        self,
+        model_path: Optional[str] = None,
+        artifacts_dir: Optional[str] = None,
+        rules_version: str = "v1.0",
+        default_version: Optional[str] = None
+    ):
         self.orthopaedic_conditions = {
             "knee": [
                 "Osteoarthritis", "Meniscus Tear", "ACL Tear",
@@ -42,6 +55,18 @@ class MLPredictionService:
             ]
         }
 
+        self.body_part_synonyms = {
+            "knees": "knee", "kneecap": "knee", "patella": "knee", "meniscus": "knee",
+            "shoulders": "shoulder", "rotator cuff": "shoulder",
+            "spine": "back", "spinal": "back", "lumbar": "back", "sacrum": "back",
+            "tailbone": "back", "coccyx": "back",
+            "hips": "hip", "groin": "hip", "pelvis": "hip",
+            "ankles": "ankle", "achilles": "ankle", "heel": "ankle",
+            "wrists": "wrist", "carpal": "wrist", "hand": "wrist",
+            "elbows": "elbow",
+            "cervical": "neck"
+        }
+
         self.severity_weights = {
             "pain_level": 0.35,
             "duration": 0.25,
@@ -49,109 +74,344 @@ class MLPredictionService:
             "symptom_intensity": 0.20
         }
 
+        self.functional_keywords = ["cannot", "unable", "difficulty", "limited", "weakness"]
+        self.intense_symptoms = ["swelling", "numbness", "burning", "sharp"]
+
+        self._compile_conditions()
+
+        self.artifacts_dir = artifacts_dir
+        self.rules_version = rules_version
+        self.default_version = default_version or rules_version
+        self.previous_version = None
+        self.load_errors: Dict[str, str] = {}
+
+        self._models = {rules_version: {"version": rules_version, "model": None, "path": None}}
+        self._loaded_paths = set()
+        self._active = self._models[rules_version]
+        self._registry_lock = threading.Lock()
+        self._activation_lock = threading.RLock()
+        self._watcher = None
+        self._stop_watcher = threading.Event()
+
+        if model_path:
+            self.activate(self.load_model(model_path), persist=False)
+
+    def _compile_conditions(self):
+        general = "General Musculoskeletal Disorder"
+        self.body_parts = list(self.orthopaedic_conditions.keys())
+        part_conditions = [self.orthopaedic_conditions[part] for part in self.body_parts] + [[general]]
+
+        self.condition_names = list(dict.fromkeys(
+            condition for conditions in part_conditions for condition in conditions
+        ))
+        self.condition_ids = {name: i for i, name in enumerate(self.condition_names)}
+
+        self._body_part_lookup = {part: i for i, part in enumerate(self.body_parts)}
+        for synonym, part in self.body_part_synonyms.items():
+            self._body_part_lookup[synonym] = self._body_part_lookup[part]
+
+        lowered = [name.lower() for name in self.condition_names]
+        severe_mask = np.array([
+            any(word in name for word in ["tear", "fracture", "rupture"]) for name in lowered
+        ] + [False])
+        mild_mask = np.array([
+            any(word in name for word in ["strain", "itis"]) for name in lowered
+        ] + [False])
+        chronic_mask = np.array([
+            "chronic" in name or "itis" in name for name in lowered
+        ] + [False])
+
+        # One row per body part (plus the general fallback), one column per candidate slot.
+        # Padding slots point at an extra condition id with zero base probability.
+        padding_id = len(self.condition_names)
+        max_candidates = max(len(conditions) for conditions in part_conditions)
+        self._candidate_ids = np.full((len(part_conditions), max_candidates), padding_id, dtype=np.intp)
+        self._base_probabilities = np.zeros((len(part_conditions), max_candidates))
+        for part_index, conditions in enumerate(part_conditions):
+            self._candidate_ids[part_index, :len(conditions)] = [self.condition_ids[c] for c in conditions]
+            self._base_probabilities[part_index, :len(conditions)] = 1.0 / len(conditions)
+        self._candidate_counts = np.array([len(conditions) for conditions in part_conditions])
+
+        self._high_pain_multipliers = np.where(severe_mask[self._candidate_ids], 1.5, 1.0)
+        self._low_pain_multipliers = np.where(mild_mask[self._candidate_ids], 1.3, 1.0)
+        self._duration_multipliers = np.where(chronic_mask[self._candidate_ids], 1.2, 1.0)
+
+    @property
+    def active_version(self) -> str:
+        return self._active["version"]
+
+    def has_model(self, version: str) -> bool:
+        with self._registry_lock:
+            return version in self._models
+
+    def _model_entry(self, model_version: Optional[str]) -> Dict:
+        if model_version is None:
+            return self._active
+        entry = self._models.get(model_version)
+        if entry is None:
+            raise ValueError(f"Unknown model version: {model_version}")
+        return entry
+
+    def load_model(self, model_path: str) -> str:
+        artifact = joblib.load(model_path, mmap_mode="r")
+
+        unknown = [name for name in artifact["model"].classes_ if name not in self.condition_ids]
+        if unknown:
+            raise ValueError(f"Model predicts unknown conditions: {', '.join(unknown)}")
+        if artifact["feature_names"] != self.feature_names():
+            raise ValueError("Model was trained on a different feature layout")
+
+        version = artifact["model_version"]
+        entry = {
+            "version": version,
+            "model": artifact["model"],
+            "condition_ids": np.array(
+                [self.condition_ids[name] for name in artifact["model"].classes_],
+                dtype=np.intp
+            ),
+            "path": model_path,
+            "trained_at": artifact["trained_at"],
+            "training_samples": artifact["training_samples"],
+            "metrics": artifact.get("metrics")
+        }
+
+        with self._registry_lock:
+            if version == self.rules_version:
+                raise ValueError(f"Version {version} is reserved for the rule-based model")
+            self._models[version] = entry
+            self._loaded_paths.add(model_path)
+
+        return version
+
+    def activate(self, version: str, persist: bool = True):
+        if version not in self._models and self.artifacts_dir:
+            path = os.path.join(self.artifacts_dir, f"{version}.joblib")
+            if os.path.exists(path):
+                self.load_model(path)
+
+        with self._activation_lock:
+            if version not in self._models:
+                raise ValueError(f"Unknown model version: {version}")
+            if persist and self.artifacts_dir:
+                self._write_active_version(version)
+
+            with self._registry_lock:
+                if self._active["version"] != version:
+                    self.previous_version = self._active["version"]
+                    self._active = self._models[version]
+
+    def rollback(self) -> str:
+        if self.previous_version is None:
+            raise ValueError("No previous model version to roll back to")
+        version = self.previous_version
+        self.activate(version)
+        return version
+
+    def list_models(self) -> List[Dict]:
+        with self._registry_lock:
+            entries = list(self._models.values())
+            active = self._active["version"]
+
+        return [
+            {
+                "version": entry["version"],
+                "type": "rules" if entry["model"] is None else "classifier",
+                "active": entry["version"] == active,
+                "previous": entry["version"] == self.previous_version,
+                "path": entry["path"],
+                "trained_at": entry.get("trained_at"),
+                "training_samples": entry.get("training_samples"),
+                "metrics": entry.get("metrics")
+            }
+            for entry in entries
+        ]
+
+    def refresh_models(self) -> List[str]:
+        if not self.artifacts_dir or not os.path.isdir(self.artifacts_dir):
+            return []
+
+        loaded = []
+        for name in sorted(os.listdir(self.artifacts_dir)):
+            path = os.path.join(self.artifacts_dir, name)
+            if not name.endswith(".joblib") or path in self._loaded_paths:
+                continue
+            try:
+                loaded.append(self.load_model(path))
+                self.load_errors.pop(path, None)
+            except Exception as e:
+                self.load_errors[path] = f"{type(e).__name__}: {e}"
+
+        # Workers follow the version recorded by whichever worker last handled POST /models.
+        with self._activation_lock:
+            target = self._read_active_version() or self.default_version
+            if target != self.active_version and target in self._models:
+                self.activate(target, persist=False)
+
+        return loaded
+
+    def start_watcher(self, poll_seconds: float):
+        if self._watcher is not None or poll_seconds <= 0:
+            return
+
+        def watch():
+            while not self._stop_watcher.wait(poll_seconds):
+                self.refresh_models()
+
+        self._watcher = threading.Thread(target=watch, name="model-registry-watcher", daemon=True)
+        self._watcher.start()
+
+    def _read_active_version(self) -> Optional[str]:
+        try:
+            with open(os.path.join(self.artifacts_dir, ACTIVE_VERSION_FILE)) as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+
+    def _write_active_version(self, version: str):
+        os.makedirs(self.artifacts_dir, exist_ok=True)
+        path = os.path.join(self.artifacts_dir, ACTIVE_VERSION_FILE)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(version)
+        os.replace(tmp_path, path)
+
+    def feature_names(self) -> List[str]:
+        return [f"body_part_{part}" for part in self.body_parts + ["other"]] + [
+            "pain_level", "duration_days", "age"
+        ]
+
+    def build_feature_matrix(self, df) -> np.ndarray:
+        df = pd.DataFrame(df)
+        part_index, pain_level, duration_days, age = self._batch_inputs(df)
+        return self._feature_matrix(part_index, pain_level, duration_days, age)
+
+    def _feature_matrix(
+        self,
+        part_index: np.ndarray,
+        pain_level: np.ndarray,
+        duration_days: np.ndarray,
+        age: np.ndarray
+    ) -> np.ndarray:
+        return np.column_stack([
+            np.eye(len(self.body_parts) + 1)[part_index],
+            np.where(np.isnan(pain_level), 5, pain_level),
+            np.where(np.isnan(duration_days), -1, duration_days),
+            np.where(np.isnan(age), -1, age)
+        ])
+
+    def _model_probabilities(
+        self,
+        model_entry: Dict,
+        part_index: np.ndarray,
+        pain_level: np.ndarray,
+        duration_days: np.ndarray,
+        age: np.ndarray
+    ) -> np.ndarray:
+        features = self._feature_matrix(part_index, pain_level, duration_days, age)
+        model_probabilities = model_entry["model"].predict_proba(features)
+
+        probabilities = np.zeros((len(part_index), len(self.condition_names) + 1))
+        probabilities[:, model_entry["condition_ids"]] = model_probabilities
+
+        # Restrict to the body part's candidate conditions; fall back to the
+        # uniform prior where the model gives them no mass (e.g. unknown body parts).
+        candidate_probabilities = np.take_along_axis(probabilities, self._candidate_ids[part_index], axis=1)
+        totals = candidate_probabilities.sum(axis=1, keepdims=True)
+        return np.where(
+            totals > 0,
+            candidate_probabilities / np.where(totals > 0, totals, 1),
+            self._base_probabilities[part_index]
+        )
+
     def predict_condition(
         self,
-        symptom_data: Dict
+        symptom_data: Dict,
+        age: Optional[int] = None,
+        top_k: Optional[int] = None
     ) -> Tuple[List[Dict], Dict]:
         body_part = symptom_data.get("affected_body_part", "").lower()
         pain_level = symptom_data.get("pain_level", 5)
-        duration = symptom_data.get("duration", "")
+        duration_days = self.resolve_duration_days(symptom_data)
         symptoms = symptom_data.get("additional_symptoms", [])
+        model_entry = self._active
+
+        part_index = self._body_part_index(body_part)
+        if model_entry["model"] is not None:
+            probabilities = self._model_probabilities(
+                model_entry,
+                np.array([part_index]),
+                np.array([pain_level], dtype=float),
+                np.array([duration_days], dtype=float),
+                np.array([age], dtype=float)
+            )[0]
+        else:
+            probabilities = self._calculate_probabilities(part_index, pain_level, duration_days)
 
-        possible_conditions = []
-        for part_key in self.orthopaedic_conditions.keys():
-            if part_key in body_part:
-                possible_conditions = self.orthopaedic_conditions[part_key]
-                break
-
-        if not possible_conditions:
-            possible_conditions = ["General Musculoskeletal Disorder"]
-
-        base_probabilities = self._calculate_probabilities(
-            possible_conditions,
-            pain_level,
-            duration,
-            symptoms
-        )
-
-        predictions = []
-        for condition, prob in base_probabilities.items():
-            predictions.append({
-                "condition": condition,
-                "probability": round(prob, 3),
-                "explanation": self._generate_explanation(
-                    condition,
-                    symptom_data
-                )
-            })
+        rounded = [round(float(p), 3) for p in probabilities[:self._candidate_counts[part_index]]]
+        ranked_slots = sorted(range(len(rounded)), key=lambda slot: rounded[slot], reverse=True)
 
-        predictions.sort(key=lambda x: x["probability"], reverse=True)
+        predictions = [
+            {
+                "condition": self.condition_names[self._candidate_ids[part_index, slot]],
+                "probability": rounded[slot]
+            }
+            for slot in ranked_slots[:top_k]
+        ]
 
         features = {
             "body_part": body_part,
             "pain_level": pain_level,
-            "duration_category": self._categorize_duration(duration),
+            "duration_days": duration_days,
+            "duration_category": categorize_duration_days(duration_days),
             "symptom_count": len(symptoms),
-            "primary_symptoms": symptoms[:3] if symptoms else []
+            "primary_symptoms": symptoms[:3] if symptoms else [],
+            "model_version": model_entry["version"]
         }
 
         return predictions, features
 
     def _calculate_probabilities(
         self,
-        conditions: List[str],
+        part_index: int,
         pain_level: int,
-        duration: str,
-        symptoms: List[str]
-    ) -> Dict[str, float]:
-        base_prob = 1.0 / len(conditions)
-        probabilities = {}
-
-        for condition in conditions:
-            prob = base_prob
+        duration_days: Optional[int]
+    ) -> np.ndarray:
+        probabilities = self._base_probabilities[part_index]
 
-            if pain_level >= 7:
-                if any(word in condition.lower() for word in ["tear", "fracture", "rupture"]):
-                    prob *= 1.5
-            elif pain_level <= 3:
-                if any(word in condition.lower() for word in ["strain", "itis"]):
-                    prob *= 1.3
+        if pain_level >= 7:
+            probabilities = probabilities * self._high_pain_multipliers[part_index]
+        elif pain_level <= 3:
+            probabilities = probabilities * self._low_pain_multipliers[part_index]
 
-            if "week" in duration.lower() or "month" in duration.lower():
-                if "chronic" in condition.lower() or "itis" in condition.lower():
-                    prob *= 1.2
+        if duration_days is not None and 7 <= duration_days < 365:
+            probabilities = probabilities * self._duration_multipliers[part_index]
 
-            probabilities[condition] = prob
-
-        total = sum(probabilities.values())
-        probabilities = {k: v/total for k, v in probabilities.items()}
-
-        return probabilities
+        return probabilities / probabilities.sum()
 
     def predict_severity(self, symptom_data: Dict) -> Tuple[str, float]:
         pain_level = symptom_data.get("pain_level", 0)
-        duration = symptom_data.get("duration", "")
+        duration_days = self.resolve_duration_days(symptom_data)
         symptoms = symptom_data.get("additional_symptoms", [])
 
         pain_score = (pain_level / 10) * self.severity_weights["pain_level"]
 
         duration_score = 0
-        if "year" in duration.lower():
+        if duration_days is None:
+            duration_score = 0.2
+        elif duration_days >= 365:
             duration_score = 1.0
-        elif "month" in duration.lower():
+        elif duration_days >= 30:
             duration_score = 0.7
-        elif "week" in duration.lower():
+        elif duration_days >= 7:
             duration_score = 0.4
         else:
             duration_score = 0.2
         duration_score *= self.severity_weights["duration"]
 
-        functional_keywords = ["cannot", "unable", "difficulty", "limited", "weakness"]
-        functional_impact = any(kw in " ".join(symptoms).lower() for kw in functional_keywords)
+        functional_impact = any(kw in " ".join(symptoms).lower() for kw in self.functional_keywords)
         functional_score = (1.0 if functional_impact else 0.3) * self.severity_weights["functional_impact"]
 
-        intense_symptoms = ["swelling", "numbness", "burning", "sharp"]
-        symptom_intensity = sum(1 for s in symptoms if s in intense_symptoms) / max(len(symptoms), 1)
+        symptom_intensity = sum(1 for s in symptoms if s in self.intense_symptoms) / max(len(symptoms), 1)
         symptom_score = symptom_intensity * self.severity_weights["symptom_intensity"]
 
         total_score = pain_score + duration_score + functional_score + symptom_score
@@ -165,16 +425,20 @@ class MLPredictionService:
 
         return severity_level, round(total_score, 3)
 
-    def _categorize_duration(self, duration: str) -> str:
-        if not duration:
-            return "unknown"
-        duration_lower = duration.lower()
-        if "year" in duration_lower:
-            return "chronic"
-        elif "month" in duration_lower:
-            return "subacute"
-        else:
-            return "acute"
+    def resolve_duration_days(self, symptom_data: Dict) -> Optional[int]:
+        duration_days = symptom_data.get("duration_days")
+        if duration_days is not None:
+            return duration_days
+        return parse_duration_days(symptom_data.get("duration"))
+
+    def explain_predictions(self, predictions: List[Dict], symptom_data: Dict) -> List[Dict]:
+        return [
+            {
+                **prediction,
+                "explanation": self._generate_explanation(prediction["condition"], symptom_data)
+            }
+            for prediction in predictions
+        ]
 
     def _generate_explanation(self, condition: str, symptom_data: Dict) -> str:
         body_part = symptom_data.get("affected_body_part", "area")
@@ -189,7 +453,7 @@ class MLPredictionService:
         self,
         severity_score: float,
         pain_level: int,
-        duration: str,
+        duration_days: Optional[int],
         age: int
     ) -> int:
         base_score = int(severity_score * 40)
@@ -197,9 +461,8 @@ class MLPredictionService:
         pain_contribution = int((pain_level / 10) * 30)
 
         duration_contribution = 0
-        if "day" in duration.lower():
-            if "1" in duration or "2" in duration:
-                duration_contribution = 15
+        if duration_days is not None and duration_days <= 2:
+            duration_contribution = 15
 
         age_contribution = 0
         if age >= 65:
@@ -211,5 +474,147 @@ class MLPredictionService:
 
         return min(max(priority_score, 1), 100)
 
+    def predict_batch(self, df, model_version: Optional[str] = None) -> pd.DataFrame:
+        model_entry = self._model_entry(model_version)
+        df = pd.DataFrame(df)
+        n = len(df)
+        part_index, pain_level, duration_days, age = self._batch_inputs(df)
+
+        symptoms = self._column(df, "additional_symptoms", None).reset_index(drop=True).explode()
+        symptom_count = symptoms.notna().groupby(level=0).sum().reindex(range(n), fill_value=0).to_numpy()
+        intense_count = symptoms.isin(self.intense_symptoms).groupby(level=0).sum().reindex(range(n), fill_value=0).to_numpy()
+        functional_impact = (
+            symptoms.astype("string").str.lower()
+            .str.contains("|".join(self.functional_keywords), regex=True)
+            .fillna(False).astype(bool)
+            .groupby(level=0).any().reindex(range(n), fill_value=False).to_numpy()
+        )
 
-ml_service = MLPredictionService()
+        if model_entry["model"] is not None:
+            candidate_probabilities = self._model_probabilities(
+                model_entry, part_index, pain_level, duration_days, age
+            )
+        else:
+            candidate_probabilities = self._batch_probabilities(
+                part_index,
+                np.where(np.isnan(pain_level), 5, pain_level),
+                duration_days
+            )
+        candidate_ids = self._candidate_ids[part_index]
+        top_slots = candidate_probabilities.argmax(axis=1)
+        top_ids = candidate_ids[np.arange(n), top_slots]
+
+        probabilities = np.zeros((n, len(self.condition_names) + 1))
+        np.put_along_axis(probabilities, candidate_ids, candidate_probabilities, axis=1)
+
+        weights = self.severity_weights
+        pain_score = (np.where(np.isnan(pain_level), 0, pain_level) / 10) * weights["pain_level"]
+        duration_score = np.select(
+            [duration_days >= 365, duration_days >= 30, duration_days >= 7],
+            [1.0, 0.7, 0.4],
+            0.2
+        ) * weights["duration"]
+        functional_score = np.where(functional_impact, 1.0, 0.3) * weights["functional_impact"]
+        symptom_score = (intense_count / np.maximum(symptom_count, 1)) * weights["symptom_intensity"]
+        total_score = pain_score + duration_score + functional_score + symptom_score
+        severity_score = np.round(total_score, 3)
+
+        priority_score = (
+            np.floor(severity_score * 40)
+            + np.floor((np.where(np.isnan(pain_level), 5, pain_level) / 10) * 30)
+            + np.where(duration_days <= 2, 15, 0)
+            + np.select([age >= 65, age <= 18], [10, 5], 0)
+        )
+
+        result = pd.DataFrame(
+            np.round(probabilities[:, :-1], 3),
+            columns=self.condition_names,
+            index=df.index
+        )
+        result["top_condition"] = np.array(self.condition_names, dtype=object)[top_ids]
+        result["top_probability"] = np.round(candidate_probabilities[np.arange(n), top_slots], 3)
+        result["duration_days"] = duration_days
+        result["severity_level"] = np.select(
+            [total_score >= 0.7, total_score >= 0.4],
+            ["High", "Medium"],
+            "Low"
+        )
+        result["severity_score"] = severity_score
+        result["priority_score"] = np.clip(priority_score, 1, 100).astype(int)
+
+        return result
+
+    def _batch_inputs(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        body_part_codes, body_part_values = pd.factorize(
+            self._column(df, "affected_body_part", "").fillna("").astype(str).str.lower()
+        )
+        part_index = np.array(
+            [self._body_part_index(value) for value in body_part_values] + [len(self.body_parts)],
+            dtype=np.intp
+        )[body_part_codes]
+
+        pain_level = pd.to_numeric(self._column(df, "pain_level", np.nan), errors="coerce").to_numpy(dtype=float)
+        duration_days = self._batch_duration_days(df)
+        age = pd.to_numeric(self._column(df, "age", np.nan), errors="coerce").to_numpy(dtype=float)
+
+        return part_index, pain_level, duration_days, age
+
+    def _batch_probabilities(
+        self,
+        part_index: np.ndarray,
+        pain_level: np.ndarray,
+        duration_days: np.ndarray
+    ) -> np.ndarray:
+        high_pain = (pain_level >= 7)[:, None]
+        low_pain = (pain_level <= 3)[:, None]
+        mid_duration = ((duration_days >= 7) & (duration_days < 365))[:, None]
+
+        scores = self._base_probabilities[part_index] * np.where(
+            high_pain,
+            self._high_pain_multipliers[part_index],
+            np.where(low_pain, self._low_pain_multipliers[part_index], 1.0)
+        )
+        scores *= np.where(mid_duration, self._duration_multipliers[part_index], 1.0)
+
+        return scores / scores.sum(axis=1, keepdims=True)
+
+    def _batch_duration_days(self, df: pd.DataFrame) -> np.ndarray:
+        duration_days = pd.to_numeric(
+            self._column(df, "duration_days", np.nan), errors="coerce"
+        ).to_numpy(dtype=float, copy=True)
+
+        missing = np.isnan(duration_days)
+        if missing.any() and "duration" in df:
+            codes, durations = pd.factorize(df["duration"].iloc[missing])
+            parsed = np.array(
+                [parse_duration_days(duration) for duration in durations] + [None],
+                dtype=float
+            )
+            duration_days[missing] = parsed[codes]
+
+        return duration_days
+
+    def _body_part_index(self, body_part: str) -> int:
+        index = self._body_part_lookup.get(body_part)
+        if index is not None:
+            return index
+
+        for part_key, index in self._body_part_lookup.items():
+            if part_key in body_part:
+                return index
+        return len(self.body_parts)
+
+    def _column(self, df: pd.DataFrame, name: str, default) -> pd.Series:
+        if name in df:
+            return df[name]
+        return pd.Series([default] * len(df), index=df.index, dtype=object)
+
+
+settings = get_settings()
+ml_service = MLPredictionService(
+    artifacts_dir=settings.ml_artifacts_dir,
+    rules_version=settings.ml_rules_version,
+    default_version=settings.model_version
+)
+ml_service.refresh_models()
+ml_service.start_watcher(settings.ml_registry_poll_seconds)
@@ -0,0 +1,221 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from services.nlp_service import analyze_batch_worker, reextract_batch_worker
+from services.cache_service import content_key, create_cache
+from config import get_settings
+
+
+# Bump whenever the shape of an analysis changes (extraction fields, entity
+# format, DocBin encoding) so entries written by older workers are not served.
+CACHE_SCHEMA_VERSION = 1
+
+
+class NLPQueueFullError(Exception):
+    def __init__(self, retry_after: int):
+        super().__init__("NLP extraction queue is full, retry later")
+        self.retry_after = retry_after
+
+
+class SymptomExtractionBatcher:
+    def __init__(
+        self,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        execution_mode: str = "thread",
+        workers: int = 2,
+        max_queue: int = 512,
+        retry_after: int = 1,
+        cache=None,
+        cache_salt: str = ""
+    ):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.execution_mode = execution_mode
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self._executor = self._create_executor(execution_mode, workers)
+        self._pending: List[Tuple[str, bool, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._in_flight = 0
+        self.cache = cache
+        self.cache_salt = cache_salt
+
+    def _create_executor(self, execution_mode: str, workers: int) -> Executor:
+        if execution_mode == "process":
+            return ProcessPoolExecutor(max_workers=max(workers, 1))
+        if execution_mode == "thread":
+            return ThreadPoolExecutor(max_workers=1, thread_name_prefix="nlp-batch")
+        raise ValueError(f"Unknown NLP execution mode: {execution_mode}")
+
+    def _admit(self, count: int):
+        if self._in_flight + count > self.max_queue:
+            raise NLPQueueFullError(self.retry_after)
+        self._in_flight += count
+
+    def _cache_key(self, text: str) -> str:
+        return content_key(CACHE_SCHEMA_VERSION, self.cache_salt, " ".join(text.split()))
+
+    def _cache_get(self, text: str, with_entities: bool) -> Optional[Dict]:
+        if self.cache is None:
+            return None
+        cached = self.cache.get(self._cache_key(text))
+        if cached is None or (with_entities and cached["entities"] is None):
+            return None
+        return {
+            **cached,
+            "extraction": {**cached["extraction"], "processed_text": text.lower().strip()}
+        }
+
+    def _cache_set(self, text: str, analysis: Dict):
+        if self.cache is not None:
+            self.cache.set(self._cache_key(text), analysis)
+
+    async def _cached(self, texts: List[str], with_entities: bool) -> List[Optional[Dict]]:
+        def lookup():
+            return [self._cache_get(text, with_entities) for text in texts]
+
+        if self.cache is not None and self.cache.blocking:
+            return await asyncio.to_thread(lookup)
+        return lookup()
+
+    async def _store(self, items: List[Tuple[str, Dict]]):
+        def store():
+            for text, analysis in items:
+                self._cache_set(text, analysis)
+
+        if self.cache is not None and self.cache.blocking:
+            await asyncio.to_thread(store)
+        else:
+            store()
+
+    async def analyze(self, text: str, with_entities: bool = False) -> Dict:
+        cached, = await self._cached([text], with_entities)
+        if cached is not None:
+            return cached
+
+        self._admit(1)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, with_entities, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._flush)
+
+        analysis = await future
+        await self._store([(text, analysis)])
+        return analysis
+
+    async def analyze_batch(
+        self,
+        texts: List[str],
+        with_entities: bool = False,
+        batch_size: int = 64,
+        n_process: int = 1
+    ) -> List[Dict]:
+        analyses = await self._cached(texts, with_entities)
+        missing = [i for i, analysis in enumerate(analyses) if analysis is None]
+        if not missing:
+            return analyses
+
+        if self.execution_mode == "process":
+            # Pool workers are daemonic and cannot start spaCy subprocesses.
+            n_process = 1
+
+        # Admit in chunks so a batch larger than max_queue can still complete;
+        # finished chunks are cached, so a retry after a 503 resumes from there.
+        loop = asyncio.get_running_loop()
+        chunk_size = max(min(batch_size, self.max_queue), 1)
+        for offset in range(0, len(missing), chunk_size):
+            chunk = missing[offset:offset + chunk_size]
+            chunk_texts = [texts[i] for i in chunk]
+            self._admit(len(chunk_texts))
+
+            try:
+                computed = await loop.run_in_executor(
+                    self._executor,
+                    analyze_batch_worker,
+                    chunk_texts,
+                    [with_entities] * len(chunk_texts),
+                    batch_size,
+                    n_process
+                )
+            finally:
+                self._in_flight -= len(chunk_texts)
+
+            for i, analysis in zip(chunk, computed):
+                analyses[i] = analysis
+            await self._store([(texts[i], analyses[i]) for i in chunk])
+
+        return analyses
+
+    async def reextract_batch(self, items: List[Tuple[str, str]]) -> List[Dict]:
+        self._admit(len(items))
+        loop = asyncio.get_running_loop()
+
+        try:
+            return await loop.run_in_executor(self._executor, reextract_batch_worker, items)
+        finally:
+            self._in_flight -= len(items)
+
+    def stats(self) -> Dict:
+        return {
+            "execution_mode": self.execution_mode,
+            "in_flight": self._in_flight,
+            "max_queue": self.max_queue,
+            "cache": self.cache.stats() if self.cache is not None else None
+        }
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            asyncio.ensure_future(self._run_batch(batch))
+
+    async def _run_batch(self, batch: List[Tuple[str, bool, asyncio.Future]]):
+        loop = asyncio.get_running_loop()
+        texts = [text for text, _, _ in batch]
+        with_entities = [entities_wanted for _, entities_wanted, _ in batch]
+
+        try:
+            results = await loop.run_in_executor(
+                self._executor,
+                analyze_batch_worker,
+                texts,
+                with_entities,
+                len(texts)
+            )
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self._in_flight -= len(batch)
+
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+settings = get_settings()
+nlp_batcher = SymptomExtractionBatcher(
+    max_batch_size=settings.nlp_coalesce_max_batch,
+    max_wait_ms=settings.nlp_coalesce_max_wait_ms,
+    execution_mode=settings.nlp_execution_mode,
+    workers=settings.nlp_workers,
+    max_queue=settings.nlp_max_queue,
+    retry_after=settings.nlp_retry_after_seconds,
+    cache=create_cache(
+        "nlp",
+        max_size=settings.nlp_cache_size,
+        ttl_seconds=settings.nlp_cache_ttl_seconds,
+        redis_url=settings.cache_redis_url
+    ) if settings.nlp_cache_size > 0 else None,
+    cache_salt=settings.nlp_profile
+)
@@ -1,23 +1,111 @@
 import spacy
+from spacy.matcher import PhraseMatcher
+from spacy.tokens import DocBin, Span
+from spacy.util import filter_spans
 from typing import Dict, List, Optional, Tuple
+from config import get_settings
+from services.duration_utils import (
+    DURATION_PATTERN,
+    categorize_duration_days,
+    duration_match_to_days
+)
+import base64
 import re
 
 
+PIPELINE_PROFILES = {
+    "full": [],
+    "extraction": ["parser", "ner"],
+}
+
+
+def _edit_distance(a: str, b: str) -> int:
+    previous_row = None
+    row = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        previous_row, row, current = row, [i] + [0] * len(b), previous_row
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            row[j] = min(row[j - 1] + 1, previous_row[j] + 1, previous_row[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                row[j] = min(row[j], current[j - 2] + 1)
+    return row[len(b)]
+
+
+class SymmetricDeleteIndex:
+    def __init__(self, terms, max_edit_distance: int = 2):
+        self.max_edit_distance = max_edit_distance
+        self.terms = set(terms)
+        self.deletes: Dict[str, set] = {}
+        for term in self.terms:
+            for variant in self._deletes(term, max_edit_distance):
+                self.deletes.setdefault(variant, set()).add(term)
+
+    def _deletes(self, word: str, distance: int) -> set:
+        variants = {word}
+        frontier = {word}
+        for _ in range(distance):
+            frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+            variants |= frontier
+        return variants
+
+    def lookup(self, word: str) -> Optional[str]:
+        if word in self.terms:
+            return word
+
+        short = len(word) <= 5
+        max_distance = 1 if short else self.max_edit_distance
+        candidates = set()
+        for variant in self._deletes(word, max_distance):
+            candidates |= self.deletes.get(variant, set())
+        if short:
+            candidates = {c for c in candidates if c[0] == word[0]}
+
+        best = None
+        best_distance = max_distance + 1
+        for candidate in sorted(candidates):
+            distance = _edit_distance(word, candidate)
+            if distance < best_distance:
+                best, best_distance = candidate, distance
+
+        return best
+
+
+def load_common_words(path: Optional[str]) -> set:
+    if not path:
+        return set()
+    with open(path) as f:
+        return {line.strip().lower() for line in f if line.strip() and not line.startswith("#")}
+
+
 class MedicalNLPService:
-    def __init__(self):
+    def __init__(
+        self,
+        profile: str = "extraction",
+        spelling_correction: bool = True,
+        common_words_path: Optional[str] = None
+    ):
+        if profile not in PIPELINE_PROFILES:
+            raise ValueError(f"Unknown NLP pipeline profile: {profile}")
+        self.profile = profile
+        self.spelling_correction = spelling_correction
+
+        disabled = PIPELINE_PROFILES[profile]
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            self.nlp = spacy.load("en_core_web_sm", disable=disabled)
         except OSError:
             import subprocess
             subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
-            self.nlp = spacy.load("en_core_web_sm")
+            self.nlp = spacy.load("en_core_web_sm", disable=disabled)
 
         self.orthopaedic_body_parts = {
             "knee", "knees", "shoulder", "shoulders", "hip", "hips",
             "ankle", "ankles", "wrist", "wrists", "elbow", "elbows",
             "back", "spine", "neck", "leg", "legs", "arm", "arms",
             "hand", "hands", "foot", "feet", "finger", "fingers",
-            "toe", "toes", "jaw", "pelvis", "rib", "ribs"
+            "toe", "toes", "jaw", "pelvis", "rib", "ribs",
+            "lower back", "upper back", "rotator cuff", "achilles tendon",
+            "kneecap", "heel", "thigh", "calf", "forearm", "collarbone"
         }
 
         self.symptom_keywords = {
@@ -25,34 +113,142 @@ class MedicalNLPService:
             "swelling", "swollen", "inflammation", "stiff", "stiffness",
             "weakness", "weak", "numbness", "numb", "tingling", "burning",
             "sharp", "dull", "throbbing", "radiating", "limited", "difficulty",
-            "fracture", "broken", "sprain", "strain", "tear", "injury"
+            "fracture", "broken", "sprain", "strain", "tear", "injury",
+            "pins and needles", "giving way", "locking", "clicking",
+            "popping", "grinding", "cramp", "spasm", "limited range of motion"
         }
 
-        self.duration_pattern = re.compile(
-            r'(\d+)\s*(day|days|week|weeks|month|months|year|years)',
-            re.IGNORECASE
-        )
+        self.duration_pattern = DURATION_PATTERN
 
         self.pain_level_pattern = re.compile(
             r'(pain|severity|level|intensity).*?(\d{1,2})\s*(?:out of|\/|\s)?\s*10',
             re.IGNORECASE
         )
 
-    def extract_symptoms(self, text: str) -> Dict:
-        doc = self.nlp(text.lower())
+        self.lower_matcher = PhraseMatcher(self.nlp.vocab, attr="LOWER")
+        self.lemma_matcher = PhraseMatcher(self.nlp.vocab, attr="LEMMA")
+        self._add_phrase_patterns("BODY_PART", self.orthopaedic_body_parts)
+        self._add_phrase_patterns("SYMPTOM", self.symptom_keywords)
+
+        self.term_labels = {
+            **{term: "SYMPTOM" for term in self.symptom_keywords if " " not in term},
+            **{term: "BODY_PART" for term in self.orthopaedic_body_parts if " " not in term}
+        }
+        self.spelling_index = SymmetricDeleteIndex(self.term_labels.keys())
+        self.min_correction_length = 4
+        self.common_words = load_common_words(common_words_path) - set(self.term_labels)
+
+    def _add_phrase_patterns(self, label: str, terms: set):
+        sorted_terms = sorted(terms)
+        self.lower_matcher.add(label, [self.nlp.make_doc(term) for term in sorted_terms])
+        self.lemma_matcher.add(label, list(self.nlp.pipe(sorted_terms)))
+
+    def _match_vocabulary(self, doc) -> Tuple[List[str], List[str], List[Dict]]:
+        spans = [
+            Span(doc, start, end, label=match_id)
+            for matcher in (self.lower_matcher, self.lemma_matcher)
+            for match_id, start, end in matcher(doc)
+        ]
 
         affected_parts = []
         symptoms = []
+        matched_tokens = set()
+        for span in filter_spans(spans):
+            matched_tokens.update(range(span.start, span.end))
+            if span.label_ == "BODY_PART":
+                affected_parts.append(span.text.lower())
+            else:
+                symptoms.append(span.text.lower())
+
+        corrections = []
+        if self.spelling_correction:
+            for token in doc:
+                if token.i in matched_tokens or not self._is_correctable(token):
+                    continue
+
+                correction = self.spelling_index.lookup(token.lower_)
+                if correction is None:
+                    continue
+
+                if correction != token.lower_:
+                    corrections.append({"text": token.text, "correction": correction})
+                if self.term_labels[correction] == "BODY_PART":
+                    affected_parts.append(correction)
+                else:
+                    symptoms.append(correction)
+
+        return affected_parts, symptoms, corrections
+
+    def _is_correctable(self, token) -> bool:
+        # Ordinary English ("week", "feel", "morning") sits within one or two
+        # edits of vocabulary terms, so only words outside the common-word
+        # list are candidates. token.is_oov is no help here: the small
+        # pipelines ship without vectors, so every token is OOV.
+        return (
+            token.is_alpha
+            and len(token) >= self.min_correction_length
+            and not token.is_stop
+            and token.lower_ not in self.common_words
+        )
+
+    def extract_symptoms(self, text: str) -> Dict:
+        doc = self.nlp(text)
+        return self._build_extraction(doc, text)
+
+    def extract_symptoms_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 64,
+        n_process: int = 1
+    ) -> List[Dict]:
+        docs = self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        return [self._build_extraction(doc, text) for doc, text in zip(docs, texts)]
+
+    def analyze(self, text: str, with_entities: bool = True) -> Dict:
+        return self.analyze_batch([text], [with_entities])[0]
+
+    def analyze_batch(
+        self,
+        texts: List[str],
+        with_entities: Optional[List[bool]] = None,
+        batch_size: int = 64,
+        n_process: int = 1
+    ) -> List[Dict]:
+        if with_entities is None:
+            with_entities = [False] * len(texts)
+
+        docs = self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+
+        analyses = []
+        for doc, text, entities_wanted in zip(docs, texts, with_entities):
+            if entities_wanted:
+                doc = self._apply_ner(doc)
+            analyses.append({
+                "extraction": self._build_extraction(doc, text),
+                "entities": self._entities_from_doc(doc) if entities_wanted else None,
+                "doc_bin": self.serialize_doc(doc)
+            })
+
+        return analyses
+
+    def serialize_doc(self, doc) -> str:
+        doc_bin = DocBin(store_user_data=False)
+        doc_bin.add(doc)
+        return base64.b64encode(doc_bin.to_bytes()).decode("ascii")
+
+    def load_doc(self, doc_bin: str):
+        return next(DocBin().from_bytes(base64.b64decode(doc_bin)).get_docs(self.nlp.vocab))
+
+    def reextract_from_doc_bin(self, doc_bin: str, text: str) -> Dict:
+        return self._build_extraction(self.load_doc(doc_bin), text)
+
+    def _build_extraction(self, doc, text: str) -> Dict:
+        affected_parts, symptoms, corrections = self._match_vocabulary(doc)
         pain_level = None
         duration = None
+        duration_days = None
         confidence = 0.0
 
-        for token in doc:
-            if token.lemma_ in self.orthopaedic_body_parts:
-                affected_parts.append(token.text)
-            if token.lemma_ in self.symptom_keywords:
-                symptoms.append(token.text)
-
         pain_match = self.pain_level_pattern.search(text)
         if pain_match:
             try:
@@ -65,6 +261,7 @@ class MedicalNLPService:
         duration_match = self.duration_pattern.search(text)
         if duration_match:
             duration = duration_match.group(0)
+            duration_days = duration_match_to_days(duration_match)
 
         found_entities = len(affected_parts) + len(symptoms)
         if pain_level:
@@ -80,13 +277,23 @@ class MedicalNLPService:
             "all_affected_parts": list(set(affected_parts)),
             "pain_level": pain_level,
             "duration": duration,
+            "duration_days": duration_days,
+            "duration_category": categorize_duration_days(duration_days),
             "additional_symptoms": list(set(symptoms)),
             "extraction_confidence": round(confidence, 2),
+            "spelling_corrections": corrections,
             "processed_text": text.lower().strip()
         }
 
     def extract_medical_entities(self, text: str) -> List[Dict]:
-        doc = self.nlp(text)
+        return self._entities_from_doc(self._apply_ner(self.nlp(text)))
+
+    def _apply_ner(self, doc):
+        if "ner" in self.nlp.disabled:
+            doc = self.nlp.get_pipe("ner")(doc)
+        return doc
+
+    def _entities_from_doc(self, doc) -> List[Dict]:
         entities = []
 
         for ent in doc.ents:
@@ -100,4 +307,21 @@ class MedicalNLPService:
         return entities
 
 
-nlp_service = MedicalNLPService()
+nlp_service = MedicalNLPService(
+    profile=get_settings().nlp_profile,
+    spelling_correction=get_settings().nlp_spelling_correction,
+    common_words_path=get_settings().nlp_common_words_path
+)
+
+
+def analyze_batch_worker(
+    texts: List[str],
+    with_entities: List[bool],
+    batch_size: int = 64,
+    n_process: int = 1
+) -> List[Dict]:
+    return nlp_service.analyze_batch(texts, with_entities, batch_size, n_process)
+
+
+def reextract_batch_worker(items: List[Tuple[str, str]]) -> List[Dict]:
+    return [nlp_service.reextract_from_doc_bin(doc_bin, text) for doc_bin, text in items]
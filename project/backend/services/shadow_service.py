@@ -0,0 +1,184 @@
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+import numpy as np
+from services.ml_service import ml_service
+from config import get_settings
+
+
+logger = logging.getLogger(__name__)
+
+SHADOW_FEATURE_FIELDS = [
+    "affected_body_part", "pain_level", "duration", "duration_days", "additional_symptoms"
+]
+
+
+class ShadowScorer:
+    def __init__(
+        self,
+        service,
+        candidate_version: Optional[str],
+        writer: Callable[[List[Dict]], None],
+        max_queue: int = 1000,
+        batch_size: int = 100,
+        flush_seconds: float = 5.0,
+        top_k: int = 3
+    ):
+        self.service = service
+        self.candidate_version = candidate_version or None
+        self.writer = writer
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.top_k = top_k
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._counters = {
+            "submitted": 0,
+            "dropped": 0,
+            "skipped": 0,
+            "written": 0,
+            "failed": 0
+        }
+
+        self._worker = None
+        if self.candidate_version:
+            self._worker = threading.Thread(target=self._run, name="shadow-scorer", daemon=True)
+            self._worker.start()
+
+    @property
+    def enabled(self) -> bool:
+        return self.candidate_version is not None
+
+    def submit(
+        self,
+        prediction_id: str,
+        symptom_data: Dict,
+        age: Optional[int],
+        live_model_version: str,
+        live_top_condition: str
+    ) -> bool:
+        if not self.enabled or live_model_version == self.candidate_version:
+            return False
+
+        record = {
+            "prediction_id": prediction_id,
+            "symptom_id": symptom_data["id"],
+            "patient_id": symptom_data["patient_id"],
+            "live_model_version": live_model_version,
+            "live_top_condition": live_top_condition,
+            "features": {
+                **{field: symptom_data.get(field) for field in SHADOW_FEATURE_FIELDS},
+                "age": age
+            }
+        }
+
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self._count("dropped")
+            return False
+
+        self._count("submitted")
+        return True
+
+    def score(self, records: List[Dict]) -> List[Dict]:
+        result = self.service.predict_batch(
+            [record["features"] for record in records],
+            model_version=self.candidate_version
+        )
+        condition_names = self.service.condition_names
+        probabilities = result[condition_names].to_numpy()
+        top_ids = np.argsort(-probabilities, axis=1, kind="stable")[:, :self.top_k]
+
+        rows = []
+        for i, record in enumerate(records):
+            rows.append({
+                "prediction_id": record["prediction_id"],
+                "symptom_id": record["symptom_id"],
+                "patient_id": record["patient_id"],
+                "live_model_version": record["live_model_version"],
+                "live_top_condition": record["live_top_condition"],
+                "shadow_model_version": self.candidate_version,
+                "shadow_top_condition": result["top_condition"].iat[i],
+                "shadow_top_probability": float(result["top_probability"].iat[i]),
+                "shadow_predicted_conditions": [
+                    {"condition": condition_names[j], "probability": float(probabilities[i, j])}
+                    for j in top_ids[i]
+                    if probabilities[i, j] > 0
+                ]
+            })
+
+        return rows
+
+    def stats(self) -> Dict:
+        with self._lock:
+            counters = dict(self._counters)
+        return {
+            "enabled": self.enabled,
+            "candidate_version": self.candidate_version,
+            "queued": self._queue.qsize(),
+            "max_queue": self._queue.maxsize,
+            **counters
+        }
+
+    def _count(self, name: str, amount: int = 1):
+        with self._lock:
+            self._counters[name] += amount
+
+    def _next_batch(self) -> List[Dict]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.flush_seconds
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+
+            if not self.service.has_model(self.candidate_version):
+                # Candidate artifact not (yet) loaded in this worker.
+                self._count("skipped", len(batch))
+                continue
+
+            try:
+                rows = self.score(batch)
+            except Exception:
+                # Shadow scoring is off the request path; a bad candidate
+                # must never kill the worker and silently stop the queue.
+                logger.exception("Shadow scoring failed for %d records", len(batch))
+                self._count("failed", len(batch))
+                continue
+
+            try:
+                self.writer(rows)
+                self._count("written", len(rows))
+            except Exception:
+                logger.exception("Writing %d shadow predictions failed", len(rows))
+                self._count("failed", len(rows))
+
+
+def write_shadow_predictions(rows: List[Dict]):
+    from database import supabase
+
+    supabase.table("shadow_predictions").insert(rows).execute()
+
+
+settings = get_settings()
+shadow_scorer = ShadowScorer(
+    ml_service,
+    candidate_version=settings.ml_shadow_version,
+    writer=write_shadow_predictions,
+    max_queue=settings.ml_shadow_max_queue,
+    batch_size=settings.ml_shadow_batch_size,
+    flush_seconds=settings.ml_shadow_flush_seconds
+)
@@ -1,18 +1,23 @@
 import whisper
+import numpy as np
 import os
-from typing import Optional
+import time
+import torch
+from typing import Dict, List, Optional, Tuple, Union
+from services.vad import EnergyVAD
+from services.text_normalizer import MedicalTextNormalizer
+from config import get_settings
 
 
-class SpeechToTextService:
-    def __init__(self, model_size: str = "base"):
-        self.model = whisper.load_model(model_size)
+class WhisperBackend:
+    name = "whisper"
 
-    def transcribe_audio(self, audio_file_path: str, language: str = "en") -> dict:
-        if not os.path.exists(audio_file_path):
-            raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
+    def __init__(self, model_size: str = "base"):
+        self.model = whisper.load_model(model_size, device="cpu")
 
+    def transcribe(self, audio: Union[str, np.ndarray], language: str = "en") -> dict:
         result = self.model.transcribe(
-            audio_file_path,
+            audio,
             language=language,
             task="transcribe",
             fp16=False
@@ -24,25 +29,219 @@ class SpeechToTextService:
             "segments": result.get("segments", [])
         }
 
-    def normalize_medical_text(self, text: str) -> str:
-        replacements = {
-            "nee": "knee",
-            "bac": "back",
-            "sholder": "shoulder",
-            "ancle": "ankle",
-            "rist": "wrist",
-            "elbo": "elbow",
-            "hip": "hip",
-            "payn": "pain",
-            "aik": "ache",
-            "swell": "swelling",
+    def transcribe_batch(
+        self,
+        audios: List[np.ndarray],
+        language: str = "en",
+        max_batch_size: int = 8
+    ) -> List[List[dict]]:
+        chunk_samples = whisper.audio.N_SAMPLES
+        sample_rate = whisper.audio.SAMPLE_RATE
+
+        mels = []
+        owners = []
+        for index, audio in enumerate(audios):
+            for offset in range(0, max(len(audio), 1), chunk_samples):
+                chunk = audio[offset:offset + chunk_samples]
+                mels.append(whisper.log_mel_spectrogram(
+                    whisper.pad_or_trim(torch.from_numpy(chunk)),
+                    n_mels=self.model.dims.n_mels
+                ))
+                owners.append((index, offset / sample_rate, (offset + len(chunk)) / sample_rate))
+
+        options = whisper.DecodingOptions(
+            language=language,
+            task="transcribe",
+            fp16=False,
+            without_timestamps=True
+        )
+
+        texts = []
+        for start in range(0, len(mels), max_batch_size):
+            mel_batch = torch.stack(mels[start:start + max_batch_size]).to(self.model.device)
+            texts.extend(result.text.strip() for result in whisper.decode(self.model, mel_batch, options))
+
+        segments_by_audio = [[] for _ in audios]
+        for (index, start, end), text in zip(owners, texts):
+            segments_by_audio[index].append({"start": start, "end": end, "text": text})
+
+        return segments_by_audio
+
+
+class QuantizedWhisperBackend(WhisperBackend):
+    name = "whisper-int8"
+
+    def __init__(self, model_size: str = "base"):
+        super().__init__(model_size)
+        self._replace_linear_layers(self.model)
+        self.model = torch.quantization.quantize_dynamic(
+            self.model,
+            {torch.nn.Linear},
+            dtype=torch.qint8
+        )
+
+    def _replace_linear_layers(self, module: torch.nn.Module):
+        for name, child in module.named_children():
+            if isinstance(child, torch.nn.Linear) and type(child) is not torch.nn.Linear:
+                plain = torch.nn.Linear(
+                    child.in_features,
+                    child.out_features,
+                    bias=child.bias is not None
+                )
+                plain.load_state_dict(child.state_dict())
+                setattr(module, name, plain)
+            else:
+                self._replace_linear_layers(child)
+
+
+class FasterWhisperBackend:
+    name = "faster-whisper"
+
+    def __init__(self, model_size: str = "base"):
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            raise ImportError(
+                "The faster-whisper speech backend requires the faster-whisper package"
+            )
+        self.model = WhisperModel(model_size, device="cpu", compute_type="int8")
+
+    def transcribe(self, audio: Union[str, np.ndarray], language: str = "en") -> dict:
+        segments, info = self.model.transcribe(audio, language=language, task="transcribe")
+        segments = [
+            {"start": segment.start, "end": segment.end, "text": segment.text}
+            for segment in segments
+        ]
+
+        return {
+            "text": "".join(segment["text"] for segment in segments).strip(),
+            "language": info.language or language,
+            "segments": segments
         }
 
-        normalized = text.lower()
-        for wrong, correct in replacements.items():
-            normalized = normalized.replace(wrong, correct)
+    def transcribe_batch(
+        self,
+        audios: List[np.ndarray],
+        language: str = "en",
+        max_batch_size: int = 8
+    ) -> List[List[dict]]:
+        return [self.transcribe(audio, language)["segments"] for audio in audios]
+
+
+SPEECH_BACKENDS = {
+    WhisperBackend.name: WhisperBackend,
+    QuantizedWhisperBackend.name: QuantizedWhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend,
+}
+
+
+class SpeechToTextService:
+    def __init__(
+        self,
+        model_size: str = "base",
+        backend: str = "whisper",
+        vad: Optional[EnergyVAD] = None,
+        normalizer: Optional[MedicalTextNormalizer] = None
+    ):
+        if backend not in SPEECH_BACKENDS:
+            raise ValueError(f"Unknown speech backend: {backend}")
+        self.model_size = model_size
+        self.backend = SPEECH_BACKENDS[backend](model_size)
+        self.vad = vad
+        self.normalizer = normalizer or MedicalTextNormalizer({})
+
+    def _prepare_audio(self, audio: Union[str, np.ndarray]) -> Tuple[Union[str, np.ndarray], Optional[Dict]]:
+        if self.vad is None:
+            return audio, None
+        if isinstance(audio, str):
+            audio = whisper.load_audio(audio)
+        return self.vad.trim(np.asarray(audio, dtype=np.float32))
+
+    def transcribe_audio(self, audio: Union[str, np.ndarray], language: str = "en") -> dict:
+        if isinstance(audio, str) and not os.path.exists(audio):
+            raise FileNotFoundError(f"Audio file not found: {audio}")
+
+        audio, vad_stats = self._prepare_audio(audio)
+
+        if vad_stats is not None and len(audio) == 0:
+            return {"text": "", "language": language, "segments": [], "vad": vad_stats}
+
+        started = time.perf_counter()
+        transcription = self.backend.transcribe(audio, language)
+
+        if vad_stats is not None:
+            transcription["vad"] = {
+                **vad_stats,
+                "transcribe_seconds": round(time.perf_counter() - started, 3)
+            }
+        return transcription
 
-        return normalized
+    def transcribe_batch(
+        self,
+        audios: List[np.ndarray],
+        language: str = "en",
+        max_batch_size: int = 8
+    ) -> List[dict]:
+        prepared = []
+        vad_stats = []
+        for audio in audios:
+            audio, stats = self._prepare_audio(np.asarray(audio, dtype=np.float32))
+            prepared.append(audio)
+            vad_stats.append(stats)
+
+        to_decode = [i for i, audio in enumerate(prepared) if vad_stats[i] is None or len(audio) > 0]
+        decoded = self.backend.transcribe_batch(
+            [prepared[i] for i in to_decode],
+            language,
+            max_batch_size
+        )
+
+        segments_by_audio = [[] for _ in audios]
+        for i, segments in zip(to_decode, decoded):
+            segments_by_audio[i] = segments
+
+        results = []
+        for segments, stats in zip(segments_by_audio, vad_stats):
+            result = {
+                "text": " ".join(segment["text"].strip() for segment in segments if segment["text"].strip()),
+                "language": language,
+                "segments": segments
+            }
+            if stats is not None:
+                result["vad"] = stats
+            results.append(result)
+        return results
+
+    def normalize_medical_text(self, text: str) -> str:
+        return self.normalizer.normalize(text)
 
 
-speech_service = SpeechToTextService()
+speech_service = SpeechToTextService(
+    model_size=get_settings().speech_model_size,
+    backend=get_settings().speech_backend,
+    vad=EnergyVAD() if get_settings().speech_vad else None,
+    normalizer=MedicalTextNormalizer.from_file(get_settings().speech_confusions_path)
+)
+
+
+def transcribe_audio_worker(audio: np.ndarray, language: str = "en") -> dict:
+    transcription_result = speech_service.transcribe_audio(audio, language)
+
+    return {
+        **transcription_result,
+        "normalized_text": speech_service.normalize_medical_text(transcription_result["text"])
+    }
+
+
+def transcribe_batch_worker(
+    audios: List[np.ndarray],
+    language: str = "en",
+    max_batch_size: int = 8
+) -> List[dict]:
+    return [
+        {
+            **transcription_result,
+            "normalized_text": speech_service.normalize_medical_text(transcription_result["text"])
+        }
+        for transcription_result in speech_service.transcribe_batch(audios, language, max_batch_size)
+    ]
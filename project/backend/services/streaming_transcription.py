@@ -0,0 +1,105 @@
+import asyncio
+import numpy as np
+from typing import Awaitable, Callable, Dict, List
+from services.audio_decoder import SAMPLE_RATE, StreamingAudioDecoder
+from services.speech_service import speech_service
+
+
+def original_sample_offset(kept_regions: List[List[int]], trimmed_sample: int) -> int:
+    offset = 0
+    for start, end in kept_regions:
+        if trimmed_sample < offset + end - start:
+            return start + trimmed_sample - offset
+        offset += end - start
+    return kept_regions[-1][1] if kept_regions else trimmed_sample
+
+
+class StreamingTranscriptionSession:
+    def __init__(
+        self,
+        decoder: StreamingAudioDecoder,
+        transcribe: Callable[[np.ndarray], Awaitable[Dict]],
+        emit: Callable[[Dict], Awaitable[None]],
+        step_seconds: float = 2.0,
+        segment_seconds: float = 15.0,
+        poll_seconds: float = 0.1
+    ):
+        self.decoder = decoder
+        self.transcribe = transcribe
+        self.emit = emit
+        self.step_samples = int(step_seconds * SAMPLE_RATE)
+        self.segment_samples = int(segment_seconds * SAMPLE_RATE)
+        self.poll_seconds = poll_seconds
+        self.input_finished = asyncio.Event()
+        self.final_texts: List[str] = []
+
+    async def run(self):
+        window = np.zeros(0, dtype=np.float32)
+        committed_samples = 0
+        last_partial_samples = 0
+
+        while True:
+            finished = self.input_finished.is_set()
+            window = np.concatenate([window, self.decoder.take_samples()])
+
+            if len(window) >= self.segment_samples or (finished and len(window) > 0):
+                result = await self.transcribe(window)
+                cut = self._commit_point(result, len(window), finished)
+                await self._emit_final(result, committed_samples, cut)
+                committed_samples += cut
+                window = window[cut:]
+                last_partial_samples = 0
+                continue
+
+            if finished:
+                break
+
+            if len(window) - last_partial_samples >= self.step_samples:
+                result = await self.transcribe(window)
+                await self.emit({
+                    "type": "partial",
+                    "text": result["text"],
+                    "start": round(committed_samples / SAMPLE_RATE, 2),
+                    "end": round((committed_samples + len(window)) / SAMPLE_RATE, 2)
+                })
+                last_partial_samples = len(window)
+                continue
+
+            await asyncio.sleep(self.poll_seconds)
+
+        full_text = " ".join(text for text in self.final_texts if text)
+        await self.emit({
+            "type": "done",
+            "text": full_text,
+            "normalized_text": speech_service.normalize_medical_text(full_text)
+        })
+
+    def _commit_point(self, result: Dict, window_samples: int, finished: bool) -> int:
+        segments = result.get("segments", [])
+        if finished or len(segments) < 2:
+            result["committed_segments"] = segments
+            return window_samples
+
+        result["committed_segments"] = segments[:-1]
+        cut = int(segments[-1]["start"] * SAMPLE_RATE)
+        kept_regions = result.get("vad", {}).get("kept_regions")
+        if kept_regions is not None:
+            # Segment timestamps refer to the VAD-trimmed audio, not the window.
+            cut = original_sample_offset(kept_regions, cut)
+        return min(max(cut, 1), window_samples)
+
+    async def _emit_final(self, result: Dict, committed_samples: int, cut: int):
+        segments = result["committed_segments"]
+        if segments:
+            text = " ".join(segment["text"].strip() for segment in segments).strip()
+        else:
+            text = result["text"]
+
+        self.final_texts.append(text)
+        await self.emit({
+            "type": "final",
+            "text": text,
+            "normalized_text": speech_service.normalize_medical_text(text),
+            "start": round(committed_samples / SAMPLE_RATE, 2),
+            "end": round((committed_samples + cut) / SAMPLE_RATE, 2)
+        })
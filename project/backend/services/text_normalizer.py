@@ -0,0 +1,53 @@
+import json
+import re
+from typing import Dict, Optional, Tuple
+
+
+class MedicalTextNormalizer:
+    word_pattern = re.compile(r"[a-z0-9']+")
+
+    def __init__(self, confusions: Dict[str, str]):
+        self.lexicon = {
+            " ".join(wrong.lower().split()): correct
+            for wrong, correct in confusions.items()
+            if " ".join(wrong.lower().split()) != correct
+        }
+        self.max_words = max((len(wrong.split()) for wrong in self.lexicon), default=1)
+
+    @classmethod
+    def from_file(cls, path: str) -> "MedicalTextNormalizer":
+        with open(path) as f:
+            return cls(json.load(f))
+
+    def _longest_match(self, text: str, words: list, start: int) -> Tuple[Optional[str], int]:
+        phrase = words[start].group(0)
+        best = (self.lexicon.get(phrase), 1)
+        for n in range(2, min(self.max_words, len(words) - start) + 1):
+            gap = text[words[start + n - 2].end():words[start + n - 1].start()]
+            if not gap.isspace():
+                break
+            phrase = f"{phrase} {words[start + n - 1].group(0)}"
+            replacement = self.lexicon.get(phrase)
+            if replacement is not None:
+                best = (replacement, n)
+        return best
+
+    def normalize(self, text: str) -> str:
+        normalized = text.lower()
+        words = list(self.word_pattern.finditer(normalized))
+
+        pieces = []
+        last = 0
+        i = 0
+        while i < len(words):
+            replacement, length = self._longest_match(normalized, words, i)
+            if replacement is None:
+                i += 1
+                continue
+            pieces.append(normalized[last:words[i].start()])
+            pieces.append(replacement)
+            last = words[i + length - 1].end()
+            i += length
+
+        pieces.append(normalized[last:])
+        return "".join(pieces)
@@ -0,0 +1,193 @@
+import numpy as np
+import threading
+import time
+import uuid
+from functools import partial
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+from services.speech_service import transcribe_audio_worker, transcribe_batch_worker
+from services.batch_scheduler import WhisperBatchScheduler
+from services.audio_decoder import SAMPLE_RATE
+from services.cache_service import content_key, create_cache
+from config import get_settings
+
+
+class TranscriptionQueueFullError(Exception):
+    def __init__(self, retry_after: int):
+        super().__init__("Transcription queue is full, retry later")
+        self.retry_after = retry_after
+
+
+class TranscriptionJobQueue:
+    def __init__(
+        self,
+        workers: int = 2,
+        max_queue: int = 16,
+        job_ttl_seconds: float = 3600.0,
+        retry_after: int = 5,
+        batching: bool = False,
+        max_batch_size: int = 8,
+        max_wait_ms: float = 50.0,
+        cache=None,
+        cache_salt: str = ""
+    ):
+        self.max_queue = max_queue
+        self.job_ttl_seconds = job_ttl_seconds
+        self.retry_after = retry_after
+        self._executor = ProcessPoolExecutor(max_workers=max(workers, 1))
+        self._scheduler = WhisperBatchScheduler(
+            self._executor, transcribe_batch_worker, max_batch_size, max_wait_ms
+        ) if batching else None
+        self._jobs: Dict[str, Dict] = {}
+        self._futures: Dict[str, Future] = {}
+        self._active = 0
+        self._lock = threading.Lock()
+        self.cache = cache
+        self.cache_salt = cache_salt
+
+    def _cache_key(self, audio: np.ndarray, language: str) -> Optional[str]:
+        if self.cache is None:
+            return None
+        return content_key(self.cache_salt, language, np.ascontiguousarray(audio).tobytes())
+
+    def _cache_get(self, key: Optional[str]) -> Optional[Dict]:
+        if key is None:
+            return None
+        return self.cache.get(key)
+
+    def _cache_store(self, key: Optional[str], future: Future):
+        if key is not None and future.exception() is None:
+            self.cache.set(key, future.result())
+
+    def _completed(self, result: Dict) -> Future:
+        future = Future()
+        future.set_result(result)
+        return future
+
+    def _admit(self):
+        if self._active >= self.max_queue:
+            raise TranscriptionQueueFullError(self.retry_after)
+        self._active += 1
+
+    def _release(self, future: Future):
+        with self._lock:
+            self._active -= 1
+
+    def run(self, audio: np.ndarray, language: str = "en", use_cache: bool = True) -> Future:
+        key = self._cache_key(audio, language) if use_cache else None
+        cached = self._cache_get(key)
+        if cached is not None:
+            return self._completed(cached)
+
+        with self._lock:
+            self._admit()
+
+        future = self._dispatch(audio, language)
+        future.add_done_callback(self._release)
+        future.add_done_callback(partial(self._cache_store, key))
+        return future
+
+    def _dispatch(self, audio: np.ndarray, language: str) -> Future:
+        if self._scheduler is not None:
+            return self._scheduler.submit(audio, language)
+        return self._executor.submit(transcribe_audio_worker, audio, language)
+
+    def submit(self, audio: np.ndarray, patient_id: str, language: str = "en") -> Tuple[str, Future]:
+        key = self._cache_key(audio, language)
+        cached = self._cache_get(key)
+
+        with self._lock:
+            self._prune(time.time())
+            if cached is None:
+                self._admit()
+
+            job_id = str(uuid.uuid4())
+            self._jobs[job_id] = {
+                "job_id": job_id,
+                "patient_id": patient_id,
+                "status": "queued",
+                "result": None,
+                "error": None,
+                "audio_seconds": round(len(audio) / SAMPLE_RATE, 2),
+                "created_at": time.time(),
+                "finished_at": None
+            }
+
+            if cached is not None:
+                self._jobs[job_id].update({
+                    "status": "completed",
+                    "result": cached,
+                    "finished_at": time.time()
+                })
+                return job_id, self._completed(cached)
+
+        future = self._dispatch(audio, language)
+        with self._lock:
+            self._futures[job_id] = future
+        future.add_done_callback(partial(self._cache_store, key))
+        future.add_done_callback(partial(self._on_done, job_id))
+        return job_id, future
+
+    def _on_done(self, job_id: str, future: Future):
+        with self._lock:
+            self._active -= 1
+            self._futures.pop(job_id, None)
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+
+            job["finished_at"] = time.time()
+            error = future.exception()
+            if error is not None:
+                job["status"] = "failed"
+                job["error"] = str(error)
+            else:
+                job["status"] = "completed"
+                job["result"] = future.result()
+
+    def _prune(self, now: float):
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job["finished_at"] is not None and now - job["finished_at"] > self.job_ttl_seconds
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+
+            future = self._futures.get(job_id)
+            if future is not None and future.running():
+                return {**job, "status": "running"}
+            return dict(job)
+
+    def stats(self) -> Dict:
+        return {
+            "active": self._active,
+            "max_queue": self.max_queue,
+            "batching": self._scheduler is not None,
+            "cache": self.cache.stats() if self.cache is not None else None,
+            "jobs": len(self._jobs)
+        }
+
+
+settings = get_settings()
+transcription_jobs = TranscriptionJobQueue(
+    workers=settings.speech_workers,
+    max_queue=settings.speech_max_queue,
+    job_ttl_seconds=settings.speech_job_ttl_seconds,
+    retry_after=settings.speech_retry_after_seconds,
+    batching=settings.speech_batching,
+    max_batch_size=settings.speech_batch_max_size,
+    max_wait_ms=settings.speech_batch_max_wait_ms,
+    cache=create_cache(
+        "transcription",
+        max_size=settings.speech_cache_size,
+        ttl_seconds=settings.speech_cache_ttl_seconds,
+        redis_url=settings.cache_redis_url
+    ) if settings.speech_cache_size > 0 else None,
+    cache_salt=f"{settings.speech_backend}:{settings.speech_model_size}:{settings.speech_vad}"
+)
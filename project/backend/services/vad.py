@@ -0,0 +1,92 @@
+import numpy as np
+from typing import Dict, List, Tuple
+
+
+class EnergyVAD:
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        frame_ms: int = 30,
+        margin_db: float = 12.0,
+        min_threshold_db: float = -55.0,
+        max_noise_db: float = -45.0,
+        min_speech_ms: int = 120,
+        padding_ms: int = 210,
+        max_pause_ms: int = 450,
+        min_keep_ratio: float = 0.1
+    ):
+        self.sample_rate = sample_rate
+        self.frame = int(sample_rate * frame_ms / 1000)
+        self.margin_db = margin_db
+        self.min_threshold_db = min_threshold_db
+        self.max_noise_db = max_noise_db
+        self.min_speech_frames = max(min_speech_ms // frame_ms, 1)
+        self.padding_frames = padding_ms // frame_ms
+        self.max_pause_samples = int(sample_rate * max_pause_ms / 1000)
+        self.min_keep_ratio = min_keep_ratio
+
+    def speech_regions(self, audio: np.ndarray) -> List[Tuple[int, int]]:
+        n_frames = len(audio) // self.frame
+        if n_frames == 0:
+            return [(0, len(audio))] if len(audio) else []
+
+        frames = audio[:n_frames * self.frame].reshape(n_frames, self.frame)
+        rms_db = 10 * np.log10(np.mean(frames ** 2, axis=1) + 1e-10)
+        if rms_db.max() <= self.min_threshold_db:
+            return []
+
+        # The threshold is relative to the quietest frames, which only works if
+        # they are actual background noise. Continuous speech or a noisy room
+        # has no such floor, so keep the whole recording.
+        noise_db = np.percentile(rms_db, 10)
+        if noise_db > self.max_noise_db:
+            return [(0, len(audio))]
+
+        threshold = max(noise_db + self.margin_db, self.min_threshold_db)
+        speech = rms_db > threshold
+
+        edges = np.diff(np.concatenate([[0], speech.astype(np.int8), [0]]))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+
+        regions = []
+        for start, end in zip(starts, ends):
+            if end - start < self.min_speech_frames:
+                continue
+            start = max(start - self.padding_frames, 0) * self.frame
+            end = min((end + self.padding_frames) * self.frame, len(audio))
+            if regions and start <= regions[-1][1]:
+                regions[-1] = (regions[-1][0], end)
+            else:
+                regions.append((start, end))
+
+        return regions or [(0, len(audio))]
+
+    def trim(self, audio: np.ndarray) -> Tuple[np.ndarray, Dict]:
+        regions = self.speech_regions(audio)
+
+        kept = []
+        for i, (start, end) in enumerate(regions):
+            if i > 0:
+                gap_start = regions[i - 1][1]
+                gap_end = min(start, gap_start + self.max_pause_samples)
+                if gap_end > gap_start:
+                    kept.append([int(gap_start), int(gap_end)])
+            kept.append([int(start), int(end)])
+
+        if kept and sum(end - start for start, end in kept) < self.min_keep_ratio * len(audio):
+            # Dropping nearly everything is more likely a misfire than a
+            # recording that is 90% silence; let Whisper see all of it.
+            kept = [[0, len(audio)]]
+
+        trimmed = np.concatenate([audio[start:end] for start, end in kept]) if kept else audio[:0]
+        input_seconds = len(audio) / self.sample_rate
+        speech_seconds = len(trimmed) / self.sample_rate
+
+        return trimmed, {
+            "input_seconds": round(input_seconds, 2),
+            "speech_seconds": round(speech_seconds, 2),
+            "removed_seconds": round(input_seconds - speech_seconds, 2),
+            "estimated_speedup": round(input_seconds / speech_seconds, 2) if speech_seconds else None,
+            "kept_regions": kept
+        }
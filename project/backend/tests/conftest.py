@@ -0,0 +1,41 @@
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_ANON_KEY", "test-anon-key")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+os.environ.setdefault("ML_ARTIFACTS_DIR", os.path.join(BACKEND_DIR, "tests", "no-artifacts"))
+os.environ.setdefault("ML_REGISTRY_POLL_SECONDS", "0")
+
+
+def _install_blank_pipeline_fallback():
+    # The NLP tests exercise our own matching/serialisation code, not the
+    # statistical model, so fall back to a tokenizer-only pipeline when
+    # en_core_web_sm is not installed (e.g. offline CI).
+    try:
+        import spacy
+        from spacy.language import Language
+    except ImportError:
+        return
+
+    if spacy.util.is_package("en_core_web_sm"):
+        return
+
+    @Language.component("lowercase_lemmatizer")
+    def lowercase_lemmatizer(doc):
+        for token in doc:
+            token.lemma_ = token.lower_
+        return doc
+
+    def load_blank(name, disable=(), **kwargs):
+        nlp = spacy.blank("en")
+        nlp.add_pipe("lowercase_lemmatizer")
+        return nlp
+
+    spacy.load = load_blank
+
+
+_install_blank_pipeline_fallback()
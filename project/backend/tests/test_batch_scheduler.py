@@ -0,0 +1,91 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from services.batch_scheduler import WhisperBatchScheduler
+
+def fake_batch_worker(calls):
+    def worker(audios, language, max_batch_size):
+        calls.append(len(audios))
+        return [{"text": f"{language}:{len(audio)}"} for audio in audios]
+    return worker
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        yield pool
+
+
+def test_full_batch_dispatches_without_waiting(executor):
+    calls = []
+    scheduler = WhisperBatchScheduler(executor, fake_batch_worker(calls), max_batch_size=2, max_wait_ms=10_000)
+
+    first = scheduler.submit(np.zeros(100, dtype=np.float32))
+    second = scheduler.submit(np.zeros(200, dtype=np.float32))
+
+    assert first.result(timeout=5) == {"text": "en:100"}
+    assert second.result(timeout=5) == {"text": "en:200"}
+    assert calls == [2]
+
+
+def test_partial_batch_flushes_after_max_wait(executor):
+    calls = []
+    scheduler = WhisperBatchScheduler(executor, fake_batch_worker(calls), max_batch_size=8, max_wait_ms=20)
+
+    future = scheduler.submit(np.zeros(50, dtype=np.float32), language="es")
+
+    assert future.result(timeout=5) == {"text": "es:50"}
+    assert calls == [1]
+
+
+def test_cancelled_request_is_dropped_before_dispatch(executor):
+    calls = []
+    scheduler = WhisperBatchScheduler(executor, fake_batch_worker(calls), max_batch_size=8, max_wait_ms=50)
+
+    cancelled = scheduler.submit(np.zeros(10, dtype=np.float32))
+    kept = scheduler.submit(np.zeros(20, dtype=np.float32))
+    assert cancelled.cancel()
+
+    assert kept.result(timeout=5) == {"text": "en:20"}
+    assert cancelled.cancelled()
+    assert calls == [1]
+
+
+def test_fully_cancelled_batch_never_reaches_executor(executor):
+    calls = []
+    scheduler = WhisperBatchScheduler(executor, fake_batch_worker(calls), max_batch_size=8, max_wait_ms=10)
+
+    future = scheduler.submit(np.zeros(10, dtype=np.float32))
+    assert future.cancel()
+    scheduler._flush("en")
+
+    assert calls == []
+
+
+def test_worker_error_fails_every_request_in_batch(executor):
+    def failing_worker(audios, language, max_batch_size):
+        raise RuntimeError("decoder crashed")
+
+    scheduler = WhisperBatchScheduler(executor, failing_worker, max_batch_size=2, max_wait_ms=10_000)
+    first = scheduler.submit(np.zeros(10, dtype=np.float32))
+    second = scheduler.submit(np.zeros(10, dtype=np.float32))
+
+    for future in (first, second):
+        with pytest.raises(RuntimeError, match="decoder crashed"):
+            future.result(timeout=5)
+
+
+def test_resolve_skips_futures_cancelled_after_dispatch(executor):
+    scheduler = WhisperBatchScheduler(executor, fake_batch_worker([]), max_batch_size=2)
+    cancelled, kept = Future(), Future()
+    cancelled.cancel()
+    kept.set_running_or_notify_cancel()
+
+    batch_future = Future()
+    batch_future.set_result([{"text": "a"}, {"text": "b"}])
+    scheduler._resolve([cancelled, kept], batch_future)
+
+    assert cancelled.cancelled()
+    assert kept.result(timeout=5) == {"text": "b"}
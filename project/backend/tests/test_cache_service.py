@@ -0,0 +1,99 @@
+import asyncio
+import threading
+
+import pytest
+
+from services import nlp_batcher as batcher_module
+from services.cache_service import LRUCache, RedisCache
+from services.nlp_batcher import SymptomExtractionBatcher
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+class UnavailableRedis:
+    def pipeline(self):
+        raise ConnectionError("Connection refused")
+
+    def zcard(self, name):
+        raise ConnectionError("Connection refused")
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_redis_cache_is_bounded_by_max_size():
+    cache = RedisCache("", "nlp", max_size=2, client=fakeredis.FakeRedis())
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    cache.get("a")
+    cache.set("c", {"v": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1}
+    assert cache.get("c") == {"v": 3}
+    assert cache.stats()["size"] == 2
+
+
+def test_redis_namespaces_are_bounded_independently():
+    client = fakeredis.FakeRedis()
+    nlp = RedisCache("", "nlp", max_size=1, client=client)
+    speech = RedisCache("", "transcription", max_size=1, client=client)
+
+    nlp.set("key", 1)
+    speech.set("key", 2)
+
+    assert nlp.get("key") == 1
+    assert speech.get("key") == 2
+
+
+def test_redis_outage_degrades_to_misses():
+    cache = RedisCache("", "nlp", client=UnavailableRedis())
+
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert stats["errors"] == 2
+    assert stats["misses"] == 1
+    assert stats["size"] is None
+
+
+def test_batcher_runs_blocking_cache_off_the_event_loop(monkeypatch):
+    calls = []
+
+    class RecordingCache(LRUCache):
+        blocking = True
+
+        def get(self, key):
+            calls.append(threading.current_thread())
+            return super().get(key)
+
+        def set(self, key, value):
+            calls.append(threading.current_thread())
+            super().set(key, value)
+
+    def fake_worker(texts, with_entities, batch_size=64, n_process=1):
+        return [{"extraction": {"processed_text": text}, "entities": None} for text in texts]
+
+    monkeypatch.setattr(batcher_module, "analyze_batch_worker", fake_worker)
+    batcher = SymptomExtractionBatcher(cache=RecordingCache())
+
+    async def run():
+        loop_thread = threading.current_thread()
+        await batcher.analyze_batch(["knee pain"])
+        await batcher.analyze("knee pain")
+        return loop_thread
+
+    loop_thread = asyncio.run(run())
+
+    assert len(calls) == 3
+    assert all(thread is not loop_thread for thread in calls)
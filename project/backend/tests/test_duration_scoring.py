@@ -0,0 +1,115 @@
+import pytest
+
+from services.duration_utils import categorize_duration_days, parse_duration_days
+from services.ml_service import MLPredictionService
+
+
+@pytest.fixture(scope="module")
+def service():
+    return MLPredictionService()
+
+
+@pytest.mark.parametrize("text, days", [
+    ("1 day", 1),
+    ("2 days", 2),
+    ("11 days", 11),
+    ("21 days", 21),
+    ("1 week", 7),
+    ("3 Weeks", 21),
+    ("2 months", 60),
+    ("1 year", 365),
+    ("started 12 days ago", 12),
+    ("a while", None),
+    ("", None),
+    (None, None)
+])
+def test_parse_duration_days(text, days):
+    assert parse_duration_days(text) == days
+
+
+@pytest.mark.parametrize("days, category", [
+    (None, "unknown"),
+    (1, "acute"),
+    (29, "acute"),
+    (30, "subacute"),
+    (364, "subacute"),
+    (365, "chronic")
+])
+def test_categorize_duration_days(days, category):
+    assert categorize_duration_days(days) == category
+
+
+@pytest.mark.parametrize("days, bonus", [(1, 15), (2, 15), (3, 0), (11, 0), (12, 0), (None, 0)])
+def test_priority_acute_onset_bonus_only_for_first_two_days(service, days, bonus):
+    baseline = service.calculate_priority_score(0.5, 6, None, 40)
+
+    assert service.calculate_priority_score(0.5, 6, days, 40) - baseline == bonus
+
+
+def test_priority_age_and_clamping(service):
+    adult = service.calculate_priority_score(0.5, 6, None, 40)
+
+    assert service.calculate_priority_score(0.5, 6, None, 70) == adult + 10
+    assert service.calculate_priority_score(0.5, 6, None, 16) == adult + 5
+    assert service.calculate_priority_score(0.0, 0, None, 40) == 1
+    assert service.calculate_priority_score(1.0, 10, 1, 80) == 95
+
+
+def test_eleven_days_is_not_scored_as_one_day_onset(service):
+    # Regression: a substring check once matched "1 day" inside "11 days".
+    eleven = {"duration": "11 days", "pain_level": 6, "additional_symptoms": []}
+    one = {"duration": "1 day", "pain_level": 6, "additional_symptoms": []}
+
+    assert service.resolve_duration_days(eleven) == 11
+    assert service.predict_severity(eleven)[1] > service.predict_severity(one)[1]
+
+    eleven_priority = service.calculate_priority_score(0.5, 6, service.resolve_duration_days(eleven), 40)
+    one_priority = service.calculate_priority_score(0.5, 6, service.resolve_duration_days(one), 40)
+    assert one_priority - eleven_priority == 15
+
+
+def test_stored_duration_days_wins_over_text(service):
+    assert service.resolve_duration_days({"duration": "1 day", "duration_days": 400}) == 400
+
+
+@pytest.mark.parametrize("days, duration_score", [
+    (None, 0.2), (1, 0.2), (6, 0.2), (7, 0.4), (29, 0.4), (30, 0.7), (364, 0.7), (365, 1.0)
+])
+def test_severity_duration_thresholds(service, days, duration_score):
+    symptom = {"pain_level": 0, "duration_days": days, "additional_symptoms": []}
+    expected = duration_score * 0.25 + 0.3 * 0.20
+
+    assert service.predict_severity(symptom)[1] == pytest.approx(round(expected, 3))
+
+
+@pytest.mark.parametrize("pain_level, symptoms, level", [
+    (2, [], "Low"),
+    (6, ["swelling"], "Medium"),
+    (9, ["swelling", "difficulty moving"], "High")
+])
+def test_severity_levels(service, pain_level, symptoms, level):
+    symptom = {"pain_level": pain_level, "duration_days": 40, "additional_symptoms": symptoms}
+
+    assert service.predict_severity(symptom)[0] == level
+
+
+def test_batch_scoring_matches_single_row_scoring(service):
+    rows = [
+        {"affected_body_part": "knee", "pain_level": 7, "duration": "11 days", "age": 70,
+         "additional_symptoms": ["swelling"]},
+        {"affected_body_part": "back", "pain_level": 3, "duration": "1 day", "age": 30,
+         "additional_symptoms": []},
+        {"affected_body_part": "wrist", "pain_level": 9, "duration_days": 400, "age": 15,
+         "additional_symptoms": ["numbness", "difficulty gripping"]}
+    ]
+
+    result = service.predict_batch(rows)
+
+    for i, row in enumerate(rows):
+        level, score = service.predict_severity(row)
+        priority = service.calculate_priority_score(
+            score, row["pain_level"], service.resolve_duration_days(row), row["age"]
+        )
+        assert result["severity_level"].iat[i] == level
+        assert result["severity_score"].iat[i] == pytest.approx(score)
+        assert result["priority_score"].iat[i] == priority
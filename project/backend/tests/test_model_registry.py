@@ -0,0 +1,104 @@
+import os
+import warnings
+
+import joblib
+import pytest
+
+pytest.importorskip("sklearn")
+
+from services.ml_service import ACTIVE_VERSION_FILE, MLPredictionService
+from train_model import train_condition_model
+
+
+@pytest.fixture(scope="module")
+def trained_artifact():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return train_condition_model(num_samples=500, max_iter=20, seed=0)
+
+
+@pytest.fixture
+def artifacts_dir(tmp_path, trained_artifact):
+    for version in ["v2.0", "v3.0"]:
+        joblib.dump({**trained_artifact, "model_version": version}, tmp_path / f"{version}.joblib", compress=0)
+    return str(tmp_path)
+
+
+def registry(artifacts_dir):
+    service = MLPredictionService(artifacts_dir=artifacts_dir, rules_version="v1.0")
+    service.refresh_models()
+    return service
+
+
+def read_active(artifacts_dir):
+    with open(os.path.join(artifacts_dir, ACTIVE_VERSION_FILE)) as f:
+        return f.read()
+
+
+def test_refresh_loads_artifacts_without_switching_version(artifacts_dir):
+    service = registry(artifacts_dir)
+
+    versions = {entry["version"]: entry for entry in service.list_models()}
+    assert set(versions) == {"v1.0", "v2.0", "v3.0"}
+    assert service.active_version == "v1.0"
+    assert versions["v2.0"]["metrics"]["accuracy"] is not None
+
+
+def test_activate_persists_version_for_other_workers(artifacts_dir):
+    service = registry(artifacts_dir)
+    service.activate("v2.0")
+
+    assert service.active_version == "v2.0"
+    assert read_active(artifacts_dir) == "v2.0"
+    _, features = service.predict_condition({"affected_body_part": "knee", "pain_level": 6}, age=50)
+    assert features["model_version"] == "v2.0"
+
+    other_worker = registry(artifacts_dir)
+    assert other_worker.active_version == "v2.0"
+
+
+def test_rollback_restores_previous_version(artifacts_dir):
+    service = registry(artifacts_dir)
+    service.activate("v2.0")
+    service.activate("v3.0")
+
+    assert service.rollback() == "v2.0"
+    assert service.active_version == "v2.0"
+    assert service.previous_version == "v3.0"
+    assert read_active(artifacts_dir) == "v2.0"
+
+
+def test_rollback_without_history_fails(artifacts_dir):
+    service = registry(artifacts_dir)
+
+    with pytest.raises(ValueError, match="No previous model version"):
+        service.rollback()
+    assert service.active_version == "v1.0"
+
+
+def test_unknown_version_leaves_active_model_in_place(artifacts_dir):
+    service = registry(artifacts_dir)
+    service.activate("v2.0")
+
+    with pytest.raises(ValueError, match="Unknown model version"):
+        service.activate("v9.9")
+    assert service.active_version == "v2.0"
+    assert read_active(artifacts_dir) == "v2.0"
+
+
+def test_artifact_cannot_shadow_rules_version(artifacts_dir, trained_artifact):
+    path = os.path.join(artifacts_dir, "rules.joblib")
+    joblib.dump({**trained_artifact, "model_version": "v1.0"}, path, compress=0)
+
+    service = registry(artifacts_dir)
+
+    assert "reserved for the rule-based model" in service.load_errors[path]
+    assert service._models["v1.0"]["model"] is None
+
+
+def test_has_model_reports_loaded_versions(artifacts_dir):
+    service = registry(artifacts_dir)
+
+    assert service.has_model("v1.0")
+    assert service.has_model("v2.0")
+    assert not service.has_model("v9.9")
@@ -0,0 +1,108 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from services import nlp_batcher as batcher_module
+from services.cache_service import create_cache
+from services.nlp_batcher import NLPQueueFullError, SymptomExtractionBatcher
+
+
+@pytest.fixture
+def worker_calls(monkeypatch):
+    calls = []
+
+    def fake_worker(texts, with_entities, batch_size=64, n_process=1):
+        calls.append({"texts": list(texts), "n_process": n_process})
+        return [
+            {
+                "extraction": {"processed_text": text.lower().strip()},
+                "entities": [] if wanted else None
+            }
+            for text, wanted in zip(texts, with_entities)
+        ]
+
+    monkeypatch.setattr(batcher_module, "analyze_batch_worker", fake_worker)
+    return calls
+
+
+def test_concurrent_requests_are_coalesced_into_one_batch(worker_calls):
+    batcher = SymptomExtractionBatcher(max_batch_size=8, max_wait_ms=20)
+
+    async def run():
+        return await asyncio.gather(*(
+            batcher.analyze(f"knee pain {i}") for i in range(3)
+        ))
+
+    analyses = asyncio.run(run())
+
+    assert [a["extraction"]["processed_text"] for a in analyses] == [
+        "knee pain 0", "knee pain 1", "knee pain 2"
+    ]
+    assert len(worker_calls) == 1
+    assert batcher.stats()["in_flight"] == 0
+
+
+def test_full_batch_flushes_before_max_wait(worker_calls):
+    batcher = SymptomExtractionBatcher(max_batch_size=2, max_wait_ms=10_000)
+
+    async def run():
+        return await asyncio.wait_for(
+            asyncio.gather(batcher.analyze("a"), batcher.analyze("b")),
+            timeout=5
+        )
+
+    asyncio.run(run())
+
+    assert worker_calls == [{"texts": ["a", "b"], "n_process": 1}]
+
+
+def test_batch_larger_than_queue_runs_in_chunks(worker_calls):
+    batcher = SymptomExtractionBatcher(max_queue=2)
+
+    analyses = asyncio.run(batcher.analyze_batch(["a", "b", "c", "d", "e"], batch_size=64))
+
+    assert [a["extraction"]["processed_text"] for a in analyses] == ["a", "b", "c", "d", "e"]
+    assert [call["texts"] for call in worker_calls] == [["a", "b"], ["c", "d"], ["e"]]
+    assert batcher.stats()["in_flight"] == 0
+
+
+def test_busy_queue_is_rejected_with_retry_after(worker_calls):
+    batcher = SymptomExtractionBatcher(max_queue=2, retry_after=7)
+    batcher._in_flight = 2
+
+    with pytest.raises(NLPQueueFullError) as excinfo:
+        asyncio.run(batcher.analyze_batch(["a"]))
+
+    assert excinfo.value.retry_after == 7
+    assert worker_calls == []
+    assert batcher._in_flight == 2
+
+
+def test_cached_texts_skip_the_worker(worker_calls):
+    batcher = SymptomExtractionBatcher(cache=create_cache("test-nlp", max_size=16))
+
+    asyncio.run(batcher.analyze_batch(["Knee pain", "Back pain"]))
+    analyses = asyncio.run(batcher.analyze_batch(["Knee   pain", "Neck pain"]))
+
+    assert [call["texts"] for call in worker_calls] == [["Knee pain", "Back pain"], ["Neck pain"]]
+    assert analyses[0]["extraction"]["processed_text"] == "knee   pain"
+
+
+def test_process_mode_forces_single_spacy_process(worker_calls):
+    batcher = SymptomExtractionBatcher(execution_mode="process", workers=1)
+    batcher._executor.shutdown()
+    batcher._executor = ThreadPoolExecutor(max_workers=1)
+
+    asyncio.run(batcher.analyze_batch(["knee pain"], n_process=4))
+
+    assert worker_calls[0]["n_process"] == 1
+
+
+def test_cache_key_includes_schema_version(monkeypatch):
+    batcher = SymptomExtractionBatcher(cache_salt="extraction")
+    key = batcher._cache_key("knee pain")
+
+    monkeypatch.setattr(batcher_module, "CACHE_SCHEMA_VERSION", batcher_module.CACHE_SCHEMA_VERSION + 1)
+
+    assert batcher._cache_key("knee pain") != key
@@ -0,0 +1,33 @@
+import pytest
+
+pytest.importorskip("spacy")
+
+from services.nlp_service import nlp_service
+
+
+def test_analyze_batch_round_trips_doc_bin():
+    texts = [
+        "Sharp pain in my left knee for 2 weeks, about 7 out of 10.",
+        "My shoulder has been stiff for 3 months."
+    ]
+
+    analyses = nlp_service.analyze_batch(texts)
+
+    assert len(analyses) == 2
+    first = analyses[0]["extraction"]
+    assert first["affected_body_part"] == "knee"
+    assert first["pain_level"] == 7
+    assert first["duration_days"] == 14
+    assert analyses[0]["entities"] is None
+
+    for analysis, text in zip(analyses, texts):
+        assert isinstance(analysis["doc_bin"], str)
+        reextracted = nlp_service.reextract_from_doc_bin(analysis["doc_bin"], text)
+        assert reextracted == analysis["extraction"]
+
+
+def test_analyze_uses_single_text_path():
+    analysis = nlp_service.analyze("Numbness in my wrist", with_entities=False)
+
+    assert analysis["extraction"]["affected_body_part"] == "wrist"
+    assert "numbness" in analysis["extraction"]["additional_symptoms"]
@@ -0,0 +1,126 @@
+import time
+
+import pandas as pd
+import pytest
+
+from services.shadow_service import ShadowScorer
+
+CONDITIONS = ["Tendinitis", "Sprain"]
+
+
+class FakeModelService:
+    condition_names = CONDITIONS
+
+    def __init__(self, failures, versions=("v2",)):
+        self.failures = list(failures)
+        self.versions = set(versions)
+
+    def has_model(self, version):
+        return version in self.versions
+
+    def predict_batch(self, features, model_version=None):
+        if self.failures:
+            raise self.failures.pop(0)
+        return pd.DataFrame({
+            "Tendinitis": [0.7] * len(features),
+            "Sprain": [0.3] * len(features),
+            "top_condition": ["Tendinitis"] * len(features),
+            "top_probability": [0.7] * len(features)
+        })
+
+
+def submit(scorer, n):
+    for i in range(n):
+        scorer.submit(
+            f"prediction-{i}",
+            {"id": f"symptom-{i}", "patient_id": "patient", "affected_body_part": "knee"},
+            age=40,
+            live_model_version="rules",
+            live_top_condition="Sprain"
+        )
+
+
+def wait_for(scorer, **expected):
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        stats = scorer.stats()
+        if all(stats[name] == value for name, value in expected.items()):
+            return stats
+        time.sleep(0.01)
+    pytest.fail(f"shadow scorer stats never reached {expected}: {scorer.stats()}")
+
+
+def test_unexpected_scoring_error_is_counted_and_worker_survives():
+    written = []
+    scorer = ShadowScorer(
+        FakeModelService([RuntimeError("corrupt artifact")]),
+        candidate_version="v2",
+        writer=written.extend,
+        batch_size=1,
+        flush_seconds=0.01
+    )
+
+    submit(scorer, 2)
+    stats = wait_for(scorer, failed=1, written=1)
+
+    assert stats["skipped"] == 0
+    assert [row["shadow_top_condition"] for row in written] == ["Tendinitis"]
+    assert scorer._worker.is_alive()
+
+
+def test_unloaded_candidate_is_skipped_not_failed():
+    scorer = ShadowScorer(
+        FakeModelService([], versions=()),
+        candidate_version="v2",
+        writer=lambda rows: None,
+        batch_size=1,
+        flush_seconds=0.01
+    )
+
+    submit(scorer, 1)
+    stats = wait_for(scorer, skipped=1)
+
+    assert stats["failed"] == 0
+
+
+def test_value_error_from_loaded_candidate_is_a_failure(caplog):
+    scorer = ShadowScorer(
+        FakeModelService([ValueError("X has 12 features, but StandardScaler is expecting 11")]),
+        candidate_version="v2",
+        writer=lambda rows: None,
+        batch_size=1,
+        flush_seconds=0.01
+    )
+
+    with caplog.at_level("ERROR", logger="services.shadow_service"):
+        submit(scorer, 1)
+        stats = wait_for(scorer, failed=1)
+
+    assert stats["skipped"] == 0
+    assert "Shadow scoring failed" in caplog.text
+
+
+def test_writer_error_is_counted_as_failed():
+    def broken_writer(rows):
+        raise ConnectionError("database unavailable")
+
+    scorer = ShadowScorer(
+        FakeModelService([]),
+        candidate_version="v2",
+        writer=broken_writer,
+        batch_size=2,
+        flush_seconds=0.01
+    )
+
+    submit(scorer, 2)
+    wait_for(scorer, failed=2)
+    assert scorer._worker.is_alive()
+
+
+def test_matching_live_version_is_not_shadowed():
+    scorer = ShadowScorer(FakeModelService([]), candidate_version="v2", writer=lambda rows: None)
+
+    accepted = scorer.submit("p", {"id": "s", "patient_id": "x"}, 30, "v2", "Sprain")
+
+    assert not accepted
+    assert scorer.stats()["submitted"] == 0
@@ -0,0 +1,55 @@
+import pytest
+
+pytest.importorskip("spacy")
+
+from services.nlp_service import SymmetricDeleteIndex, nlp_service
+
+
+COMMON_WORDS = [
+    "feel", "felt", "year", "hear", "week", "hard", "less", "harm",
+    "full", "heal", "paid", "morning", "running"
+]
+
+
+def test_index_recovers_single_edit_misspellings():
+    index = SymmetricDeleteIndex(["shoulder", "swelling", "numbness", "ankle"])
+
+    assert index.lookup("sholder") == "shoulder"
+    assert index.lookup("swelingg") == "swelling"
+    assert index.lookup("numbnes") == "numbness"
+    assert index.lookup("ankle") == "ankle"
+
+
+def test_index_requires_matching_first_letter_for_short_words():
+    index = SymmetricDeleteIndex(["tear", "feet", "ankle"])
+
+    assert index.lookup("tear") == "tear"
+    assert index.lookup("year") is None
+    assert index.lookup("ancle") == "ankle"
+
+
+@pytest.mark.parametrize("word", COMMON_WORDS)
+def test_common_words_are_not_corrected(word):
+    extraction = nlp_service.extract_symptoms(f"I {word} it")
+
+    assert extraction["spelling_corrections"] == []
+    assert extraction["all_affected_parts"] == []
+    assert extraction["additional_symptoms"] == []
+
+
+def test_dataset_phrases_do_not_invent_terms():
+    extraction = nlp_service.extract_symptoms(
+        "I feel stiffness in my knee in the morning, it started 1 week ago and has lasted a year."
+    )
+
+    assert extraction["all_affected_parts"] == ["knee"]
+    assert set(extraction["additional_symptoms"]) == {"stiffness"}
+    assert extraction["spelling_corrections"] == []
+
+
+def test_misspelled_terms_are_still_corrected():
+    extraction = nlp_service.extract_symptoms("sharp payn in my sholder with swelingg")
+
+    corrected = {c["correction"] for c in extraction["spelling_corrections"]}
+    assert corrected == {"pain", "shoulder", "swelling"}
+    assert extraction["affected_body_part"] == "shoulder"
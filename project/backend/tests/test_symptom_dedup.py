@@ -0,0 +1,153 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("spacy")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from routes import symptoms as symptoms_route
+from services.dedup_service import MinHashLSHIndex, laterality
+from services.nlp_service import nlp_service
+
+
+class FakeInsert:
+    def __init__(self, table, records):
+        self.table = table
+        self.records = records if isinstance(records, list) else [records]
+
+    def execute(self):
+        rows = [{"id": record.get("id", f"generated-{i}"), **record} for i, record in enumerate(self.records)]
+        self.table.rows.extend(rows)
+        return type("Result", (), {"data": rows})()
+
+
+class FakeTable:
+    def __init__(self):
+        self.rows = []
+
+    def insert(self, records):
+        return FakeInsert(self, records)
+
+
+class FakeSupabase:
+    def __init__(self):
+        self.symptoms = FakeTable()
+
+    def table(self, name):
+        assert name == "symptoms"
+        return self.symptoms
+
+
+@pytest.fixture
+def client(monkeypatch):
+    async def analyze_batch(texts, **kwargs):
+        return nlp_service.analyze_batch(texts)
+
+    fake_db = FakeSupabase()
+    index = MinHashLSHIndex(threshold=0.8)
+    monkeypatch.setattr(symptoms_route, "supabase", fake_db)
+    monkeypatch.setattr(symptoms_route, "dedup_service", index)
+    monkeypatch.setattr(symptoms_route.nlp_batcher, "analyze_batch", analyze_batch)
+    monkeypatch.setattr(symptoms_route.settings, "dedup_enabled", True)
+
+    app = FastAPI()
+    app.include_router(symptoms_route.router)
+    return TestClient(app), fake_db, index
+
+
+TEXT = "Sharp pain in my left knee for the past two weeks, worse on stairs."
+
+
+def test_repeats_within_one_batch_link_to_first_item(client):
+    test_client, fake_db, index = client
+    response = test_client.post("/symptoms/extract/batch", json={"items": [
+        {"patient_id": "patient-a", "symptom_text": TEXT},
+        {"patient_id": "patient-a", "symptom_text": TEXT + " "},
+        {"patient_id": "patient-b", "symptom_text": TEXT}
+    ]})
+
+    assert response.status_code == 200
+    first, repeat, other_patient = fake_db.symptoms.rows
+    assert first["duplicate_of"] is None
+    assert repeat["duplicate_of"] == first["id"]
+    assert other_patient["duplicate_of"] is None
+
+    results = response.json()["results"]
+    assert results[1]["duplicate"]["symptom_id"] == first["id"]
+    assert index.stats()["entries"] == 2
+
+
+def test_batch_item_links_to_previously_indexed_submission(client):
+    test_client, fake_db, _ = client
+    test_client.post("/symptoms/extract/batch", json={"items": [
+        {"patient_id": "patient-a", "symptom_text": TEXT}
+    ]})
+    original_id = fake_db.symptoms.rows[0]["id"]
+
+    test_client.post("/symptoms/extract/batch", json={"items": [
+        {"patient_id": "patient-a", "symptom_text": TEXT},
+        {"patient_id": "patient-a", "symptom_text": "My lower back has been stiff every morning."}
+    ]})
+
+    repeat, unrelated = fake_db.symptoms.rows[1:]
+    assert repeat["duplicate_of"] == original_id
+    assert unrelated["duplicate_of"] is None
+
+
+
+def submit_pair(test_client, fake_db, first_text, second_text):
+    test_client.post("/symptoms/extract/batch", json={"items": [
+        {"patient_id": "patient-a", "symptom_text": first_text}
+    ]})
+    test_client.post("/symptoms/extract/batch", json={"items": [
+        {"patient_id": "patient-a", "symptom_text": second_text}
+    ]})
+    original, resubmission = fake_db.symptoms.rows[-2:]
+    return original, resubmission
+
+
+REPORT = (
+    "I have had a sharp, aching pain in my {side} knee for the past {duration} and it is "
+    "worse on stairs. The pain is {pain} out of 10 and there is some swelling."
+)
+BASELINE = {"side": "left", "duration": "2 weeks", "pain": 3}
+
+
+@pytest.mark.parametrize("changed", [{"pain": 9}, {"side": "right"}, {"duration": "2 months"}])
+def test_changed_clinical_details_are_not_duplicates(client, changed):
+    test_client, fake_db, index = client
+    first_text = REPORT.format(**BASELINE)
+    second_text = REPORT.format(**{**BASELINE, **changed})
+    assert index.best_match(
+        index.signature(second_text.lower()),
+        [("original", index.signature(first_text.lower()))]
+    ) is not None
+
+    _, resubmission = submit_pair(test_client, fake_db, first_text, second_text)
+
+    assert resubmission["duplicate_of"] is None
+
+
+def test_reworded_resubmission_with_same_details_is_linked(client):
+    test_client, fake_db, _ = client
+    original, resubmission = submit_pair(
+        test_client,
+        fake_db,
+        REPORT.format(**BASELINE),
+        REPORT.format(**BASELINE).replace("some swelling", "swelling")
+    )
+
+    assert resubmission["duplicate_of"] == original["id"]
+
+
+def test_laterality_ignores_word_fragments():
+    assert laterality("Left knee and RIGHT hip") == ("left", "right")
+    assert laterality("Pain is bright and sharp, copyright") == ()
+
+
+def test_symptom_reads_do_not_return_doc_bin():
+    columns = [column.strip() for column in symptoms_route.SYMPTOM_COLUMNS.split(",")]
+
+    assert "doc_bin" not in columns
+    assert {"id", "patient_id", "symptom_text", "duplicate_of", "duration_days"} <= set(columns)
@@ -0,0 +1,57 @@
+import os
+
+import pytest
+
+from services.text_normalizer import MedicalTextNormalizer
+
+CONFUSIONS_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "asr_confusions.json")
+
+
+@pytest.fixture(scope="module")
+def normalizer():
+    return MedicalTextNormalizer.from_file(CONFUSIONS_PATH)
+
+
+@pytest.mark.parametrize("text", [
+    "my knee hurts",
+    "pain in my wrist",
+    "sore knees and wrists",
+    "my back and shoulder",
+    "the ankle is swollen"
+])
+def test_correct_words_are_left_alone(normalizer, text):
+    # Regression: substring replacement once turned "knee" into "kknee" and
+    # "wrist" into "wwrist".
+    assert normalizer.normalize(text) == text
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("my nee hurts", "my knee hurts"),
+    ("pain in my rist", "pain in my wrist"),
+    ("my left sholder, and ancle.", "my left shoulder, and ankle."),
+    ("Nee pain", "knee pain")
+])
+def test_misheard_words_are_replaced(normalizer, text, expected):
+    assert normalizer.normalize(text) == expected
+
+
+def test_only_whole_words_are_replaced():
+    normalizer = MedicalTextNormalizer({"nee": "knee", "bac": "back"})
+
+    assert normalizer.normalize("needle in the bacon") == "needle in the bacon"
+    assert normalizer.normalize("nee, bac") == "knee, back"
+
+
+def test_multi_word_phrases_prefer_the_longest_match():
+    normalizer = MedicalTextNormalizer({"tennis el bow": "tennis elbow", "el bow": "elbow"})
+
+    assert normalizer.normalize("tennis el bow again") == "tennis elbow again"
+    assert normalizer.normalize("my el bow") == "my elbow"
+    assert normalizer.normalize("tennis, el bow") == "tennis, elbow"
+
+
+def test_identity_entries_are_ignored():
+    normalizer = MedicalTextNormalizer({"Knee": "knee"})
+
+    assert normalizer.lexicon == {}
+    assert normalizer.normalize("Knee") == "knee"
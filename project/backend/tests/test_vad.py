@@ -0,0 +1,69 @@
+import numpy as np
+
+from services.vad import EnergyVAD
+
+SAMPLE_RATE = 16000
+
+
+def tone(seconds, amplitude=0.1, frequency=220.0):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+def syllables(seconds, low_db=-12.0):
+    # Speech-like: a 4 Hz syllable envelope with ~12 dB of dynamic range and
+    # no silence anywhere in the clip.
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    floor = 10 ** (low_db / 20)
+    envelope = floor + (1 - floor) * (0.5 + 0.5 * np.sin(2 * np.pi * 4 * t))
+    return (tone(seconds) * envelope).astype(np.float32)
+
+
+def silence(seconds, level=1e-4, seed=0):
+    rng = np.random.default_rng(seed)
+    return (level * rng.standard_normal(int(seconds * SAMPLE_RATE))).astype(np.float32)
+
+
+def test_continuous_speech_without_silence_is_kept():
+    audio = syllables(5)
+
+    trimmed, stats = EnergyVAD().trim(audio)
+
+    assert len(trimmed) == len(audio)
+    assert stats["speech_seconds"] == 5.0
+    assert stats["kept_regions"] == [[0, len(audio)]]
+
+
+def test_steady_tone_is_kept():
+    audio = tone(2)
+
+    trimmed, stats = EnergyVAD().trim(audio)
+
+    assert len(trimmed) == len(audio)
+    assert stats["removed_seconds"] == 0.0
+
+
+def test_real_silence_is_trimmed():
+    audio = np.concatenate([silence(3), syllables(2), silence(4), syllables(3), silence(1)])
+
+    trimmed, stats = EnergyVAD().trim(audio)
+
+    assert 5.0 <= stats["speech_seconds"] < 7.0
+    assert stats["removed_seconds"] > 6.0
+    assert len(stats["kept_regions"]) == 3
+
+
+def test_implausibly_small_speech_falls_back_to_full_audio():
+    audio = np.concatenate([silence(14), tone(0.5), silence(15.5)])
+
+    trimmed, stats = EnergyVAD().trim(audio)
+
+    assert len(trimmed) == len(audio)
+    assert stats["kept_regions"] == [[0, len(audio)]]
+
+
+def test_digital_silence_has_no_speech():
+    trimmed, stats = EnergyVAD().trim(np.zeros(SAMPLE_RATE * 2, dtype=np.float32))
+
+    assert len(trimmed) == 0
+    assert stats["kept_regions"] == []
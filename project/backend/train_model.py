@@ -0,0 +1,85 @@
+import argparse
+import os
+import random
+import sys
+from datetime import datetime
+
+import joblib
+import pandas as pd
+from sklearn.metrics import accuracy_score, log_loss
+from sklearn.model_selection import train_test_split
+from sklearn.neural_network import MLPClassifier
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BACKEND_DIR), "data"))
+
+from generate_dataset import generate_patient_data
+from services.ml_service import MLPredictionService
+
+
+def train_condition_model(num_samples: int, max_iter: int, seed: int) -> dict:
+    service = MLPredictionService()
+    df = pd.DataFrame(generate_patient_data(num_patients=num_samples))
+
+    features = service.build_feature_matrix(df)
+    labels = df["predicted_condition"].to_numpy()
+    X_train, X_test, y_train, y_test = train_test_split(
+        features, labels, test_size=0.2, random_state=seed, stratify=labels
+    )
+
+    # Weights live in plain numpy attributes, so joblib can memory-map them
+    # (tree ensembles copy their node arrays into private buffers on load).
+    model = make_pipeline(
+        StandardScaler(),
+        MLPClassifier(
+            hidden_layer_sizes=(64, 32),
+            alpha=1e-3,
+            max_iter=max_iter,
+            early_stopping=True,
+            random_state=seed
+        )
+    )
+    model.fit(X_train, y_train)
+
+    probabilities = model.predict_proba(X_test)
+    metrics = {
+        "accuracy": round(accuracy_score(y_test, model.classes_[probabilities.argmax(axis=1)]), 4),
+        "log_loss": round(log_loss(y_test, probabilities, labels=model.classes_), 4)
+    }
+
+    return {
+        "model": model,
+        "feature_names": service.feature_names(),
+        "trained_at": datetime.now().isoformat(),
+        "training_samples": len(X_train),
+        "metrics": metrics
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the condition classifier on synthetic patient data")
+    parser.add_argument("--version", required=True, help="Model version recorded with each prediction")
+    parser.add_argument("--output-dir", default=os.path.join(BACKEND_DIR, "artifacts"))
+    parser.add_argument("--samples", type=int, default=20000)
+    parser.add_argument("--max-iter", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    artifact = train_condition_model(args.samples, args.max_iter, args.seed)
+    artifact["model_version"] = args.version
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    path = os.path.join(args.output_dir, f"{args.version}.joblib")
+    # Uncompressed so the MLP weight arrays can be memory-mapped at load time.
+    joblib.dump(artifact, path, compress=0)
+
+    print(f"Saved {path}")
+    print(f"  Training samples: {artifact['training_samples']}")
+    print(f"  Holdout accuracy: {artifact['metrics']['accuracy']}, log loss: {artifact['metrics']['log_loss']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+AUDIO_EXTENSIONS = {".wav", ".mp3", ".m4a", ".ogg", ".webm", ".flac"}
+
+
+async def _iter_file(path: str, chunk_size: int):
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+def transcribe_file(path: str, language: str, extract_symptoms: bool) -> dict:
+    from config import get_settings
+    from services.audio_decoder import CHUNK_SIZE, decode_audio_stream
+    from services.speech_service import transcribe_audio_worker
+
+    settings = get_settings()
+    audio = asyncio.run(decode_audio_stream(
+        _iter_file(path, CHUNK_SIZE),
+        max_bytes=settings.speech_max_upload_bytes,
+        max_seconds=settings.speech_max_duration_seconds
+    ))
+    transcription_result = transcribe_audio_worker(audio, language)
+
+    result = {
+        "filename": path,
+        "status": "completed",
+        "original_text": transcription_result["text"],
+        "normalized_text": transcription_result["normalized_text"],
+        "language": transcription_result["language"]
+    }
+
+    if extract_symptoms:
+        from services.nlp_service import nlp_service
+        result["extraction"] = nlp_service.extract_symptoms(transcription_result["normalized_text"])
+
+    return result
+
+
+def collect_audio_files(paths) -> list:
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.extend(
+                    os.path.join(root, name)
+                    for name in sorted(names)
+                    if os.path.splitext(name)[1].lower() in AUDIO_EXTENSIONS
+                )
+        else:
+            files.append(path)
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Transcribe a batch of audio files to NDJSON")
+    parser.add_argument("paths", nargs="+", help="Audio files or directories")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--extract", action="store_true", help="Run symptom extraction on each transcript")
+    args = parser.parse_args()
+
+    files = collect_audio_files(args.paths)
+    failed = 0
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {
+            executor.submit(transcribe_file, path, args.language, args.extract): path
+            for path in files
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                failed += 1
+                result = {"filename": futures[future], "status": "failed", "error": str(e)}
+            print(json.dumps(result), flush=True)
+
+    print(f"Transcribed {len(files) - failed}/{len(files)} files", file=sys.stderr)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -189,10 +189,19 @@ def display_results(patient, symptom_result, prediction_result):
     st.markdown("#### Predicted Conditions")
     predictions = prediction_result.get("predictions", [])
 
+    explanations = {}
+    if predictions and prediction_result.get("prediction_id"):
+        try:
+            explanation_result = api_client.get_prediction_explanations(prediction_result["prediction_id"])
+            explanations = {e["condition"]: e["explanation"] for e in explanation_result["explanations"]}
+        except Exception:
+            pass
+
     for idx, pred in enumerate(predictions[:5]):
         with st.expander(f"#{idx+1}: {pred['condition']} - {pred['probability']:.1%} probability"):
             st.write(f"**Probability:** {pred['probability']:.1%}")
-            st.write(f"**Explanation:** {pred['explanation']}")
+            if pred["condition"] in explanations:
+                st.write(f"**Explanation:** {explanations[pred['condition']]}")
 
     recommendations = prediction_result.get("recommendations", {})
 
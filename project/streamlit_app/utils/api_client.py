@@ -42,6 +42,11 @@ class APIClient:
         response.raise_for_status()
         return response.json()
 
+    def get_prediction_explanations(self, prediction_id: str) -> Dict:
+        response = requests.get(f"{self.base_url}/predictions/{prediction_id}/explanations")
+        response.raise_for_status()
+        return response.json()
+
     def get_appointment_queue(self, status: Optional[str] = "Pending") -> Dict:
         params = {"status": status} if status else {}
         response = requests.get(f"{self.base_url}/appointments/queue", params=params)
@@ -0,0 +1,9 @@
+/*
+  # Store parsed spaCy documents for symptoms
+
+  ## Changes
+  - `symptoms.doc_bin` (text) - Base64-encoded spaCy DocBin of the parsed
+    complaint, so extraction rules can be rerun without re-parsing
+*/
+
+ALTER TABLE symptoms ADD COLUMN IF NOT EXISTS doc_bin text;
@@ -0,0 +1,11 @@
+/*
+  # Structured symptom duration
+
+  ## Changes
+  - `symptoms.duration_days` (integer) - Duration normalized to days at extraction time
+  - `symptoms.duration_category` (text) - acute / subacute / chronic / unknown
+*/
+
+ALTER TABLE symptoms ADD COLUMN IF NOT EXISTS duration_days integer CHECK (duration_days >= 0);
+ALTER TABLE symptoms ADD COLUMN IF NOT EXISTS duration_category text
+  CHECK (duration_category IN ('acute', 'subacute', 'chronic', 'unknown'));
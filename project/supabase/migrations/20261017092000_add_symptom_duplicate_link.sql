@@ -0,0 +1,11 @@
+/*
+  # Near-duplicate symptom submissions
+
+  ## Changes
+  - `symptoms.duplicate_of` (uuid) - Earlier submission from the same patient whose
+    text is a near-duplicate; its prediction is reused instead of recomputed
+*/
+
+ALTER TABLE symptoms ADD COLUMN IF NOT EXISTS duplicate_of uuid REFERENCES symptoms(id) ON DELETE SET NULL;
+
+CREATE INDEX IF NOT EXISTS idx_symptoms_duplicate_of ON symptoms(duplicate_of);
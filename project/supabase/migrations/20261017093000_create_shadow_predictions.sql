@@ -0,0 +1,57 @@
+/*
+  # Shadow scoring of candidate models
+
+  ## New Tables
+  - `shadow_predictions` - Condition predictions from a candidate model version,
+    computed in the background for live `/predictions/predict` traffic
+    - `id` (uuid, primary key)
+    - `prediction_id` (uuid, foreign key) - Live prediction that was shadowed
+    - `symptom_id` (uuid, foreign key)
+    - `patient_id` (uuid, foreign key)
+    - `live_model_version` (text) - Version that served the request
+    - `live_top_condition` (text)
+    - `shadow_model_version` (text) - Candidate version
+    - `shadow_top_condition` (text)
+    - `shadow_top_probability` (float)
+    - `shadow_predicted_conditions` (jsonb) - Candidate's top conditions with probabilities
+    - `created_at` (timestamptz)
+
+  ## New Views
+  - `shadow_prediction_outcomes` - Shadow rows joined to the consultation's
+    `actual_diagnosis` with live/shadow correctness flags
+*/
+
+CREATE TABLE IF NOT EXISTS shadow_predictions (
+  id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+  prediction_id uuid NOT NULL REFERENCES predictions(id) ON DELETE CASCADE,
+  symptom_id uuid NOT NULL REFERENCES symptoms(id) ON DELETE CASCADE,
+  patient_id uuid NOT NULL REFERENCES patients(id) ON DELETE CASCADE,
+  live_model_version text NOT NULL,
+  live_top_condition text NOT NULL,
+  shadow_model_version text NOT NULL,
+  shadow_top_condition text NOT NULL,
+  shadow_top_probability float NOT NULL CHECK (shadow_top_probability >= 0 AND shadow_top_probability <= 1),
+  shadow_predicted_conditions jsonb NOT NULL DEFAULT '[]'::jsonb,
+  created_at timestamptz DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS idx_shadow_predictions_prediction ON shadow_predictions(prediction_id);
+CREATE INDEX IF NOT EXISTS idx_shadow_predictions_version ON shadow_predictions(shadow_model_version, created_at DESC);
+
+ALTER TABLE shadow_predictions ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Authenticated users can view all shadow predictions"
+  ON shadow_predictions FOR SELECT
+  TO authenticated
+  USING (true);
+
+CREATE OR REPLACE VIEW shadow_prediction_outcomes
+WITH (security_invoker = true) AS
+SELECT
+  sp.*,
+  cl.actual_diagnosis,
+  sp.live_top_condition = cl.actual_diagnosis AS live_correct,
+  sp.shadow_top_condition = cl.actual_diagnosis AS shadow_correct
+FROM shadow_predictions sp
+JOIN appointments a ON a.prediction_id = sp.prediction_id
+JOIN consultation_logs cl ON cl.appointment_id = a.id;